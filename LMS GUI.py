@@ -1,5 +1,20 @@
+import argparse
+import bisect
 import datetime
-from collections import deque
+import heapq
+import json
+import math
+import multiprocessing
+import random
+import sys
+import threading
+import time
+import tracemalloc
+import zlib
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, scrolledtext
 from tkinter.font import Font
@@ -21,20 +36,28 @@ class Book:
 
 # Node for Doubly Linked List
 class BookNode:
-    def __init__(self, book):
+    def __init__(self, book, seq=0):
         self.book = book
+        self.seq = seq  # insertion number, increases along the list
         self.prev = None
         self.next = None
 
 # Doubly Linked List for Book Inventory
 class BookInventory:
+    TOMBSTONE_LIMIT = 4096  # deletions remembered for resuming page tokens
+    
     def __init__(self):
         self.head = None
         self.tail = None
         self.size = 0
+        self.nodes = {}  # isbn: BookNode, for O(1) lookup
+        self.next_seq = 0
+        self.tombstones = OrderedDict()  # seq of a deleted book: (seq, isbn) of the book before it, oldest first
     
     def add_book(self, book):
-        new_node = BookNode(book)
+        new_node = BookNode(book, self.next_seq)
+        self.next_seq += 1
+        self.nodes[book.isbn] = new_node
         if not self.head:
             self.head = new_node
             self.tail = new_node
@@ -45,31 +68,29 @@ class BookInventory:
         self.size += 1
     
     def delete_book(self, isbn):
-        current = self.head
-        while current:
-            if current.book.isbn == isbn:
-                if current.prev:
-                    current.prev.next = current.next
-                else:
-                    self.head = current.next
-                
-                if current.next:
-                    current.next.prev = current.prev
-                else:
-                    self.tail = current.prev
-                
-                self.size -= 1
-                return True
-            current = current.next
-        return False
+        current = self.nodes.pop(isbn, None)
+        if not current:
+            return False
+        
+        if current.prev:
+            current.prev.next = current.next
+        else:
+            self.head = current.next
+        
+        if current.next:
+            current.next.prev = current.prev
+        else:
+            self.tail = current.prev
+        
+        self.size -= 1
+        self.tombstones[current.seq] = (current.prev.seq, current.prev.book.isbn) if current.prev else (None, None)
+        if len(self.tombstones) > self.TOMBSTONE_LIMIT:
+            self.tombstones.popitem(last=False)
+        return True
     
     def find_book(self, isbn):
-        current = self.head
-        while current:
-            if current.book.isbn == isbn:
-                return current.book
-            current = current.next
-        return None
+        node = self.nodes.get(isbn)
+        return node.book if node else None
     
     def get_all_books(self):
         books = []
@@ -78,16 +99,59 @@ class BookInventory:
             books.append(current.book)
             current = current.next
         return books
+    
+    def _live_predecessor(self, seq):
+        # Nearest live book inserted before the deleted book seq, collapsing the chain followed to reach it.
+        # A book's predecessor is deleted after it, so its tombstone is newer and never evicted first.
+        path = []
+        while True:
+            path.append(seq)
+            seq, isbn = self.tombstones[seq]
+            node = self.nodes.get(isbn) if seq is not None else None
+            if seq is None or (node and node.seq == seq):
+                break
+        for dead in path:
+            self.tombstones[dead] = (seq, isbn)
+        return node
+    
+    def get_books_page(self, limit=50, token=None):
+        # Returns (books, next_token); next_token is None on the last page.
+        # The token is "seq:isbn" of the last book returned. It stays valid while that book exists
+        # and for TOMBSTONE_LIMIT further deletions after it is deleted; then it raises ValueError.
+        current = self.head
+        if token is not None:
+            seq, isbn = token.split(':', 1)
+            seq = int(seq)
+            node = self.nodes.get(isbn)
+            if node and node.seq == seq:
+                current = node.next
+            elif seq in self.tombstones:
+                # That book was deleted since; resume after the nearest live book before it
+                node = self._live_predecessor(seq)
+                current = node.next if node else self.head
+            else:
+                raise ValueError("Unknown or expired page token.")
+        
+        books = []
+        while current and len(books) < limit:
+            books.append(current.book)
+            last = current
+            current = current.next
+        
+        if current is None or not books:
+            return books, None
+        return books, f"{last.seq}:{last.book.isbn}"
 
 # Node for Binary Search Tree
 class BSTNode:
     def __init__(self, key, book):
-        self.key = key
+        self.key = key  # (search key, isbn), so books sharing a title or author get their own nodes
         self.book = book
         self.left = None
         self.right = None
+        self.height = 1
 
-# Binary Search Tree for Book Search
+# Self-balancing (AVL) Binary Search Tree for Book Search
 class BookSearchTree:
     def __init__(self, key_type='isbn'):
         self.root = None
@@ -99,11 +163,11 @@ class BookSearchTree:
     
     def get_key(self, book):
         if self.key_type == 'isbn':
-            return book.isbn
+            return (book.isbn, book.isbn)
         elif self.key_type == 'title':
-            return book.title.lower()
+            return (book.title.lower(), book.isbn)
         else:  # author
-            return book.author.lower()
+            return (book.author.lower(), book.isbn)
     
     def _insert(self, node, key, book):
         if not node:
@@ -114,6 +178,67 @@ class BookSearchTree:
         elif key > node.key:
             node.right = self._insert(node.right, key, book)
         
+        return self._rebalance(node)
+    
+    def remove(self, book):
+        key = self.get_key(book)
+        self.root = self._remove(self.root, key, book)
+    
+    def _remove(self, node, key, book):
+        if not node:
+            return None
+        
+        if key < node.key:
+            node.left = self._remove(node.left, key, book)
+        elif key > node.key:
+            node.right = self._remove(node.right, key, book)
+        elif node.book is book:
+            if not node.left:
+                return node.right
+            if not node.right:
+                return node.left
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.key, node.book = successor.key, successor.book
+            node.right = self._remove(node.right, successor.key, successor.book)
+        
+        return self._rebalance(node)
+    
+    # AVL balancing keeps the height O(log n), even for sorted input
+    def _height(self, node):
+        return node.height if node else 0
+    
+    def _update_height(self, node):
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+    
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+    
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+    
+    def _rebalance(self, node):
+        self._update_height(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
         return node
     
     def search(self, key):
@@ -124,9 +249,9 @@ class BookSearchTree:
         if not node:
             return None
         
-        if key == node.key:
+        if key == node.key[0]:
             return node.book
-        elif key < node.key:
+        elif key < node.key[0]:
             return self._search(node.left, key)
         else:
             return self._search(node.right, key)
@@ -141,14 +266,67 @@ class BookSearchTree:
         if not node:
             return
         
-        if node.key.startswith(prefix):
+        if node.key[0].startswith(prefix):
             results.append(node.book)
             self._search_by_prefix(node.left, prefix, results)
             self._search_by_prefix(node.right, prefix, results)
-        elif prefix < node.key:
+        elif prefix < node.key[0]:
             self._search_by_prefix(node.left, prefix, results)
         else:
             self._search_by_prefix(node.right, prefix, results)
+    
+    # Range Scans
+    def _normalize(self, key):
+        if key is None or self.key_type == 'isbn':
+            return key
+        return key.lower()
+    
+    def _iter_nodes(self, start=None, end=None, after=None):
+        # In-order walk of keys in [start, end), strictly after the (key, isbn) cursor if given.
+        # Seeking costs O(log n); each further key is O(1) amortized.
+        # (key,) sorts before every (key, isbn), so the bounds cover all books sharing a key.
+        start = (start,) if start is not None else None
+        end = (end,) if end is not None else None
+        stack = []
+        node = self.root
+        while node:
+            if (start is not None and node.key < start) or (after is not None and node.key <= after):
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            if end is not None and node.key >= end:
+                return
+            yield node
+            node = node.right
+            while node:
+                stack.append(node)
+                node = node.left
+    
+    def iter_range(self, start=None, end=None):
+        for node in self._iter_nodes(self._normalize(start), self._normalize(end)):
+            yield node.book
+    
+    def page(self, start=None, end=None, limit=20, cursor=None):
+        # Returns (books, next_cursor); next_cursor is the (key, isbn) of the last book, None on the last page
+        books = []
+        last_key = None
+        nodes = self._iter_nodes(self._normalize(start), self._normalize(end), cursor and tuple(cursor))
+        for node in nodes:
+            if len(books) == limit:
+                return books, last_key
+            books.append(node.book)
+            last_key = node.key
+        return books, None
+    
+    def prefix_range(self, prefix):
+        # Half-open [start, end) covering every key that starts with prefix
+        prefix = self._normalize(prefix)
+        if not prefix:
+            return None, None
+        return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
 
 # User Class
 class User:
@@ -161,47 +339,967 @@ class User:
     def __str__(self):
         return f"ID: {self.user_id}, Name: {self.name}, Email: {self.email}, Borrowed Books: {len(self.borrowed_books)}"
 
+# Sorted Prefix Index over (key, user_id) pairs
+class PrefixIndex:
+    def __init__(self):
+        self.entries = []  # sorted list of (key, user_id)
+    
+    def add(self, key, user_id):
+        bisect.insort(self.entries, (key, user_id))
+    
+    def remove(self, key, user_id):
+        index = bisect.bisect_left(self.entries, (key, user_id))
+        if index < len(self.entries) and self.entries[index] == (key, user_id):
+            del self.entries[index]
+    
+    def search(self, prefix, limit=None):
+        # O(log n) to find the first match, then one step per result
+        results = []
+        index = bisect.bisect_left(self.entries, (prefix,))
+        while index < len(self.entries) and self.entries[index][0].startswith(prefix):
+            if limit is not None and len(results) == limit:
+                break
+            results.append(self.entries[index][1])
+            index += 1
+        return results
+
 # User Management
 class UserManager:
     def __init__(self):
         self.users = {}  # user_id: User object
+        self.order = []  # (seq, User) in registration order, deleted users removed lazily
+        self.next_seq = 0
+        self.deleted = 0
+        self.email_index = {}  # email (lower-cased): user_id, emails are unique
+        self.name_index = {}  # name (lower-cased): set of user_ids
+        self.email_prefixes = PrefixIndex()
+        self.name_prefixes = PrefixIndex()
     
-    def add_user(self, user):
-        if user.user_id in self.users:
+    def add_user(self, user, check_email=True):
+        if user.user_id in self.users or (check_email and user.email.lower() in self.email_index):
             return False
         self.users[user.user_id] = user
+        self.order.append((self.next_seq, user))
+        self.next_seq += 1
+        self._index_user(user)
         return True
     
+    def _index_user(self, user):
+        email, name = user.email.lower(), user.name.lower()
+        self.email_index.setdefault(email, user.user_id)
+        self.name_index.setdefault(name, set()).add(user.user_id)
+        self.email_prefixes.add(email, user.user_id)
+        self.name_prefixes.add(name, user.user_id)
+    
+    def _unindex_user(self, user):
+        email, name = user.email.lower(), user.name.lower()
+        if self.email_index.get(email) == user.user_id:
+            del self.email_index[email]
+        user_ids = self.name_index[name]
+        user_ids.discard(user.user_id)
+        if not user_ids:
+            del self.name_index[name]
+        self.email_prefixes.remove(email, user.user_id)
+        self.name_prefixes.remove(name, user.user_id)
+    
     def get_user(self, user_id):
         return self.users.get(user_id)
     
+    def is_email_taken(self, email, user_id=None):
+        owner = self.email_index.get(email.lower())
+        return owner is not None and owner != user_id
+    
     def update_user(self, user_id, name=None, email=None):
         user = self.users.get(user_id)
         if not user:
             return False
         
+        if email and self.is_email_taken(email, user_id):
+            return False
+        
+        self._unindex_user(user)
         if name:
             user.name = name
         if email:
             user.email = email
+        self._index_user(user)
         return True
     
+    def find_by_email(self, email):
+        user_id = self.email_index.get(email.lower())
+        return self.users.get(user_id) if user_id is not None else None
+    
+    def find_by_name(self, name):
+        return [self.users[user_id] for user_id in sorted(self.name_index.get(name.lower(), ()))]
+    
+    def search_by_name_prefix(self, prefix, limit=None):
+        return [self.users[user_id] for user_id in self.name_prefixes.search(prefix.lower(), limit)]
+    
+    def search_by_email_prefix(self, prefix, limit=None):
+        return [self.users[user_id] for user_id in self.email_prefixes.search(prefix.lower(), limit)]
+    
     def delete_user(self, user_id):
         if user_id in self.users:
-            del self.users[user_id]
+            self._unindex_user(self.users.pop(user_id))
+            self.deleted += 1
+            if self.deleted > len(self.order) // 2:
+                self.order = [(seq, user) for seq, user in self.order if self.users.get(user.user_id) is user]
+                self.deleted = 0
             return True
         return False
     
     def get_all_users(self):
         return list(self.users.values())
+    
+    def get_users_page(self, limit=50, token=None):
+        # Returns (users, next_token); the token is the seq of the last user returned
+        index = 0
+        if token is not None:
+            index = bisect.bisect_right(self.order, int(token), key=lambda entry: entry[0])
+        
+        users = []
+        last_seq = None
+        while index < len(self.order):
+            seq, user = self.order[index]
+            index += 1
+            if self.users.get(user.user_id) is not user:
+                continue
+            if len(users) == limit:
+                return users, str(last_seq)
+            users.append(user)
+            last_seq = seq
+        return users, None
 
 # Action Class for Undo/Redo
 class Action:
-    def __init__(self, action_type, user_id, isbn, due_date=None):
+    def __init__(self, action_type, user_id, isbn, due_date=None, barcode=None, fine=0, hold=None):
         self.action_type = action_type  # 'borrow' or 'return'
         self.user_id = user_id
         self.isbn = isbn
         self.due_date = due_date
+        self.barcode = barcode
+        self.fine = fine  # fine charged by a return, reversed if it is undone
+        self.hold = hold  # Hold served by this borrow, put back in line if it is undone
+
+# Copy states
+COPY_AVAILABLE = 0
+COPY_ON_LOAN = 1
+COPY_WITHDRAWN = 2
+
+# Copy-level Inventory stored in compact parallel arrays (barcode = array index)
+class CopyStore:
+    def __init__(self):
+        self.states = bytearray()  # barcode: copy state
+        self.book_ids = array('i')  # barcode: book id
+        self.next_free = array('i')  # barcode: next free copy of the same book, -1 at end
+        self.prev_free = array('i')  # barcode: previous free copy of the same book, -1 at start
+        self.free_heads = array('i')  # book id: first free copy, -1 if none
+        self.book_id_by_isbn = {}  # isbn: book id
+        self.isbns = []  # book id: isbn
+    
+    def __len__(self):
+        return len(self.states)
+    
+    def _book_id(self, isbn):
+        book_id = self.book_id_by_isbn.get(isbn)
+        if book_id is None:
+            book_id = len(self.isbns)
+            self.book_id_by_isbn[isbn] = book_id
+            self.isbns.append(isbn)
+            self.free_heads.append(-1)
+        return book_id
+    
+    def add_copies(self, isbn, count):
+        if count <= 0:
+            return range(0)
+        book_id = self._book_id(isbn)
+        first = len(self.states)
+        last = first + count - 1
+        # New copies are contiguous, so chain them in bulk ahead of the old free list
+        head = self.free_heads[book_id]
+        self.states.extend(bytes(count))
+        self.book_ids.extend(array('i', [book_id]) * count)
+        self.next_free.extend(range(first + 1, last + 1))
+        self.next_free.append(head)
+        self.prev_free.append(-1)
+        self.prev_free.extend(range(first, last))
+        if head != -1:
+            self.prev_free[head] = last
+        self.free_heads[book_id] = first
+        return range(first, last + 1)
+    
+    def _link(self, book_id, barcode):
+        head = self.free_heads[book_id]
+        self.prev_free[barcode] = -1
+        self.next_free[barcode] = head
+        if head != -1:
+            self.prev_free[head] = barcode
+        self.free_heads[book_id] = barcode
+    
+    def _unlink(self, barcode):
+        prev, nxt = self.prev_free[barcode], self.next_free[barcode]
+        if prev != -1:
+            self.next_free[prev] = nxt
+        else:
+            self.free_heads[self.book_ids[barcode]] = nxt
+        if nxt != -1:
+            self.prev_free[nxt] = prev
+        self.prev_free[barcode] = self.next_free[barcode] = -1
+    
+    def is_valid(self, barcode):
+        return isinstance(barcode, int) and 0 <= barcode < len(self.states)
+    
+    def get_isbn(self, barcode):
+        return self.isbns[self.book_ids[barcode]]
+    
+    def get_state(self, barcode):
+        return self.states[barcode]
+    
+    def find_free_copy(self, isbn):
+        book_id = self.book_id_by_isbn.get(isbn)
+        if book_id is None:
+            return -1
+        return self.free_heads[book_id]
+    
+    def checkout(self, barcode):
+        if self.states[barcode] != COPY_AVAILABLE:
+            return False
+        self._unlink(barcode)
+        self.states[barcode] = COPY_ON_LOAN
+        return True
+    
+    def checkin(self, barcode):
+        if self.states[barcode] != COPY_ON_LOAN:
+            return False
+        self.states[barcode] = COPY_AVAILABLE
+        self._link(self.book_ids[barcode], barcode)
+        return True
+    
+    def withdraw(self, isbn, count):
+        # Take free copies out of circulation, e.g. when quantity is reduced
+        withdrawn = 0
+        while withdrawn < count:
+            barcode = self.find_free_copy(isbn)
+            if barcode == -1:
+                break
+            self._unlink(barcode)
+            self.states[barcode] = COPY_WITHDRAWN
+            withdrawn += 1
+        return withdrawn
+
+# Timer Event scheduled on the timing wheel
+class TimerEvent:
+    def __init__(self, tick, callback, data=None):
+        self.tick = tick
+        self.callback = callback
+        self.data = data
+        self.slot = None  # set holding the event while it is pending
+
+# Hierarchical Timing Wheel (one tick = one day, as a date ordinal)
+class TimingWheel:
+    SLOT_BITS = 6  # 64 slots per level
+    LEVELS = 4  # covers 64 ** 4 days ahead
+    
+    def __init__(self, current_tick):
+        self.current = current_tick
+        self.slots = [[set() for _ in range(1 << self.SLOT_BITS)] for _ in range(self.LEVELS)]
+        self.pending = 0
+    
+    def schedule(self, tick, callback, data=None):
+        # Events that are already due fire straight away
+        event = TimerEvent(tick, callback, data)
+        if tick <= self.current:
+            callback(event)
+        else:
+            self._place(event)
+        return event
+    
+    def _place(self, event):
+        delta = event.tick - self.current
+        for level in range(self.LEVELS):
+            if delta < 1 << (self.SLOT_BITS * (level + 1)):
+                break
+        else:
+            raise ValueError("Event is too far in the future for the timing wheel.")
+        slot = self.slots[level][(event.tick >> (self.SLOT_BITS * level)) & ((1 << self.SLOT_BITS) - 1)]
+        slot.add(event)
+        event.slot = slot
+        self.pending += 1
+    
+    def cancel(self, event):
+        if event.slot is None:
+            return False
+        event.slot.discard(event)
+        event.slot = None
+        self.pending -= 1
+        return True
+    
+    def advance(self, tick):
+        # Move the clock forward one tick at a time; returns the number of events fired
+        fired = 0
+        mask = (1 << self.SLOT_BITS) - 1
+        while self.current < tick:
+            self.current += 1
+            # When a lower level wraps, move the matching higher-level slot down
+            for level in range(self.LEVELS - 1, 0, -1):
+                if self.current & ((1 << (self.SLOT_BITS * level)) - 1) == 0:
+                    slot = self.slots[level][(self.current >> (self.SLOT_BITS * level)) & mask]
+                    events = list(slot)
+                    slot.clear()
+                    for event in events:
+                        event.slot = None
+                        self.pending -= 1
+                        if event.tick > self.current:
+                            self._place(event)
+                        else:
+                            self._fire(event)
+                            fired += 1
+            slot = self.slots[0][self.current & mask]
+            events = list(slot)
+            slot.clear()
+            for event in events:
+                event.slot = None
+                self.pending -= 1
+                self._fire(event)
+                fired += 1
+        return fired
+    
+    def _fire(self, event):
+        event.callback(event)
+
+# Loan Class
+class Loan:
+    def __init__(self, user_id, book, due_date, barcode=None):
+        self.user_id = user_id
+        self.book = book
+        self.isbn = book.isbn
+        self.due_date = due_date
+        self.barcode = barcode
+        self.overdue = False  # set by the scheduler when the loan becomes overdue
+        self.events = []  # pending TimerEvents for this loan
+        self.fine = 0  # fine charged when the loan was closed
+
+# Loan Table indexed by user, book and due date
+class LoanTable:
+    def __init__(self):
+        self.by_user = {}  # user_id: {isbn: Loan}
+        self.by_book = {}  # isbn: {user_id: Loan}
+        self.by_due_date = {}  # due_date: {(user_id, isbn): Loan}
+        self.by_barcode = {}  # barcode: Loan
+        self.due_dates = []  # sorted distinct due dates
+        self.size = 0
+    
+    def add(self, loan):
+        if loan.isbn in self.by_user.get(loan.user_id, {}):
+            return False
+        self.by_user.setdefault(loan.user_id, {})[loan.isbn] = loan
+        self.by_book.setdefault(loan.isbn, {})[loan.user_id] = loan
+        if loan.due_date not in self.by_due_date:
+            self.by_due_date[loan.due_date] = {}
+            bisect.insort(self.due_dates, loan.due_date)
+        self.by_due_date[loan.due_date][(loan.user_id, loan.isbn)] = loan
+        if loan.barcode is not None:
+            self.by_barcode[loan.barcode] = loan
+        self.size += 1
+        return True
+    
+    def remove(self, user_id, isbn):
+        user_loans = self.by_user.get(user_id)
+        if not user_loans or isbn not in user_loans:
+            return None
+        loan = user_loans.pop(isbn)
+        if not user_loans:
+            del self.by_user[user_id]
+        
+        book_loans = self.by_book[isbn]
+        del book_loans[user_id]
+        if not book_loans:
+            del self.by_book[isbn]
+        
+        due_loans = self.by_due_date[loan.due_date]
+        del due_loans[(user_id, isbn)]
+        if not due_loans:
+            del self.by_due_date[loan.due_date]
+            del self.due_dates[bisect.bisect_left(self.due_dates, loan.due_date)]
+        
+        if loan.barcode is not None:
+            del self.by_barcode[loan.barcode]
+        self.size -= 1
+        return loan
+    
+    def get(self, user_id, isbn):
+        return self.by_user.get(user_id, {}).get(isbn)
+    
+    def get_by_barcode(self, barcode):
+        return self.by_barcode.get(barcode)
+    
+    def get_user_loans(self, user_id):
+        return list(self.by_user.get(user_id, {}).values())
+    
+    def get_book_loans(self, isbn):
+        return list(self.by_book.get(isbn, {}).values())
+    
+    def count_book_loans(self, isbn):
+        return len(self.by_book.get(isbn, ()))
+    
+    def get_due_between(self, start, end):
+        # Loans due in [start, end), oldest due date first; O(log n) to find the buckets
+        low = bisect.bisect_left(self.due_dates, start)
+        high = bisect.bisect_left(self.due_dates, end)
+        loans = []
+        for due_date in self.due_dates[low:high]:
+            loans.extend(self.by_due_date[due_date].values())
+        return loans
+    
+    def get_due_before(self, date):
+        # Loans due strictly before date, oldest due date first
+        return self.get_due_between(datetime.date.min, date)
+
+# Hold priorities (lower value is served first)
+HOLD_PRIORITIES = {'course_reserve': 0, 'faculty': 1, 'general': 2}
+
+# Hold Class for Reservations
+class Hold:
+    def __init__(self, user_id, isbn, priority=HOLD_PRIORITIES['general'], sequence=0):
+        self.user_id = user_id
+        self.isbn = isbn
+        self.priority = priority
+        self.sequence = sequence  # arrival order, used to break priority ties
+        self.active = True
+
+# Binary Heap Priority Queue
+class PriorityQueue:
+    def __init__(self):
+        self.heap = []  # [priority, sequence, item]
+        self.position = {}  # item: index in heap
+        self.counter = 0
+    
+    def __len__(self):
+        return len(self.heap)
+    
+    def __contains__(self, item):
+        return item in self.position
+    
+    def push(self, item, priority, sequence=None):
+        if item in self.position:
+            return False
+        if sequence is None:
+            sequence = self.counter
+            self.counter += 1
+        self.heap.append([priority, sequence, item])
+        self.position[item] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+        return True
+    
+    def peek(self):
+        if not self.heap:
+            return None
+        return self.heap[0][2]
+    
+    def pop(self):
+        if not self.heap:
+            return None
+        return self._remove_at(0)
+    
+    def remove(self, item):
+        index = self.position.get(item)
+        if index is None:
+            return False
+        self._remove_at(index)
+        return True
+    
+    def decrease_key(self, item, priority):
+        index = self.position.get(item)
+        if index is None or priority >= self.heap[index][0]:
+            return False
+        self.heap[index][0] = priority
+        self._sift_up(index)
+        return True
+    
+    def _remove_at(self, index):
+        item = self.heap[index][2]
+        last = len(self.heap) - 1
+        if index != last:
+            self._swap(index, last)
+        self.heap.pop()
+        del self.position[item]
+        if index < len(self.heap):
+            self._sift_down(index)
+            self._sift_up(index)
+        return item
+    
+    def _less(self, i, j):
+        # Compare (priority, sequence) so equal priorities stay first-come, first-served
+        a, b = self.heap[i], self.heap[j]
+        return a[0] < b[0] or (a[0] == b[0] and a[1] < b[1])
+    
+    def _swap(self, i, j):
+        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        self.position[self.heap[i][2]] = i
+        self.position[self.heap[j][2]] = j
+    
+    def _sift_up(self, index):
+        while index > 0:
+            parent = (index - 1) // 2
+            if not self._less(index, parent):
+                break
+            self._swap(index, parent)
+            index = parent
+    
+    def _sift_down(self, index):
+        size = len(self.heap)
+        while True:
+            smallest = index
+            left = 2 * index + 1
+            right = left + 1
+            if left < size and self._less(left, smallest):
+                smallest = left
+            if right < size and self._less(right, smallest):
+                smallest = right
+            if smallest == index:
+                break
+            self._swap(index, smallest)
+            index = smallest
+
+# Per-book Hold Queue: FIFO deque for general holds, heap for prioritized holds
+class HoldQueue:
+    def __init__(self):
+        self.queues = {}  # isbn: deque of general Hold objects (oldest on the left)
+        self.priority_queues = {}  # isbn: PriorityQueue of prioritized Hold objects
+        self.index = {}  # (user_id, isbn): Hold object
+        self.user_holds = {}  # user_id: set of isbns
+        self.lengths = {}  # isbn: number of active holds
+        self.counter = 0
+    
+    def enqueue(self, user_id, isbn, priority=HOLD_PRIORITIES['general']):
+        if (user_id, isbn) in self.index:
+            return False
+        hold = Hold(user_id, isbn, priority, self.counter)
+        self.counter += 1
+        self._push(hold)
+        self.index[(user_id, isbn)] = hold
+        self.user_holds.setdefault(user_id, set()).add(isbn)
+        self.lengths[isbn] = self.lengths.get(isbn, 0) + 1
+        return True
+    
+    def _push(self, hold):
+        if hold.priority >= HOLD_PRIORITIES['general']:
+            self.queues.setdefault(hold.isbn, deque()).append(hold)
+        else:
+            self.priority_queues.setdefault(hold.isbn, PriorityQueue()).push(hold, hold.priority, hold.sequence)
+    
+    def cancel(self, user_id, isbn):
+        # General holds are deleted lazily and skipped on dequeue
+        hold = self.index.pop((user_id, isbn), None)
+        if not hold:
+            return False
+        hold.active = False
+        pq = self.priority_queues.get(isbn)
+        if pq is not None:
+            pq.remove(hold)
+        self._forget(hold)
+        return True
+    
+    def upgrade(self, user_id, isbn, priority):
+        hold = self.index.get((user_id, isbn))
+        if not hold or priority >= hold.priority:
+            return False
+        pq = self.priority_queues.get(isbn)
+        if pq is not None and hold in pq:
+            hold.priority = priority
+            pq.decrease_key(hold, priority)
+            return True
+        # Move a general hold into the heap, keeping its original arrival order
+        hold.active = False
+        upgraded = Hold(user_id, isbn, priority, hold.sequence)
+        self.index[(user_id, isbn)] = upgraded
+        self._push(upgraded)
+        return True
+    
+    def dequeue(self, isbn):
+        pq = self.priority_queues.get(isbn)
+        if pq:
+            hold = pq.pop()
+        else:
+            hold = None
+            queue = self.queues.get(isbn)
+            while queue:
+                candidate = queue.popleft()
+                if candidate.active:
+                    hold = candidate
+                    break
+        if not hold:
+            self.queues.pop(isbn, None)
+            return None
+        hold.active = False
+        del self.index[(hold.user_id, isbn)]
+        self._forget(hold)
+        return hold
+    
+    def peek(self, isbn):
+        # The hold dequeue would return next, without removing it
+        pq = self.priority_queues.get(isbn)
+        if pq:
+            return pq.peek()
+        queue = self.queues.get(isbn)
+        while queue and not queue[0].active:
+            queue.popleft()
+        return queue[0] if queue else None
+    
+    def restore(self, hold):
+        # Put a dequeued hold back at its original place in line, e.g. when its checkout is undone
+        if (hold.user_id, hold.isbn) in self.index:
+            return False
+        restored = Hold(hold.user_id, hold.isbn, hold.priority, hold.sequence)
+        if restored.priority >= HOLD_PRIORITIES['general']:
+            queue = self.queues.setdefault(hold.isbn, deque())
+            position = 0
+            while position < len(queue) and queue[position].sequence < restored.sequence:
+                position += 1
+            queue.insert(position, restored)
+        else:
+            self._push(restored)
+        self.index[(hold.user_id, hold.isbn)] = restored
+        self.user_holds.setdefault(hold.user_id, set()).add(hold.isbn)
+        self.lengths[hold.isbn] = self.lengths.get(hold.isbn, 0) + 1
+        return True
+    
+    def _forget(self, hold):
+        isbns = self.user_holds.get(hold.user_id)
+        if isbns is not None:
+            isbns.discard(hold.isbn)
+            if not isbns:
+                del self.user_holds[hold.user_id]
+        self.lengths[hold.isbn] -= 1
+        if not self.lengths[hold.isbn]:
+            del self.lengths[hold.isbn]
+            self.queues.pop(hold.isbn, None)
+            self.priority_queues.pop(hold.isbn, None)
+    
+    def has_hold(self, user_id, isbn):
+        return (user_id, isbn) in self.index
+    
+    def queue_length(self, isbn):
+        return self.lengths.get(isbn, 0)
+    
+    def get_user_holds(self, user_id):
+        return list(self.user_holds.get(user_id, ()))
+    
+    def cancel_user(self, user_id):
+        for isbn in self.get_user_holds(user_id):
+            self.cancel(user_id, isbn)
+    
+    def cancel_book(self, isbn):
+        holds = [hold for hold in self.queues.get(isbn, ()) if hold.active]
+        pq = self.priority_queues.get(isbn)
+        if pq is not None:
+            holds.extend(entry[2] for entry in pq.heap)
+        for hold in holds:
+            self.cancel(hold.user_id, isbn)
+    
+    def get_queue_lengths(self):
+        return dict(self.lengths)
+
+# LRU Cache for Search and Report Results
+class QueryCache:
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.entries = OrderedDict()  # key: (version, result), least recently used first
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key, version):
+        entry = self.entries.get(key)
+        if entry is None or entry[0] != version:
+            # Entries stamped with an older version are stale
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+    
+    def put(self, key, version, result):
+        self.entries[key] = (version, result)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+    
+    def clear(self):
+        self.entries.clear()
+    
+    def get_stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.entries),
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+# Latency Histogram with logarithmic buckets (4 per doubling, about 19% wide)
+class LatencyHistogram:
+    BUCKETS_PER_DOUBLING = 4
+    
+    def __init__(self):
+        self.buckets = {}  # bucket index: count
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+    
+    def record(self, elapsed_ns):
+        index = int(math.log2(max(elapsed_ns, 1)) * self.BUCKETS_PER_DOUBLING)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+    
+    def percentile(self, fraction):
+        # Upper bound of the bucket holding the requested rank
+        if not self.count:
+            return 0
+        rank = fraction * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(2 ** ((index + 1) / self.BUCKETS_PER_DOUBLING), self.max_ns)
+        return self.max_ns
+    
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'mean_us': round(self.total_ns / self.count / 1000, 3) if self.count else 0,
+            'p50_us': round(self.percentile(0.50) / 1000, 3),
+            'p95_us': round(self.percentile(0.95) / 1000, 3),
+            'p99_us': round(self.percentile(0.99) / 1000, 3),
+            'max_us': round(self.max_ns / 1000, 3),
+        }
+
+# Opt-in Metrics for LibraryManagementSystem hot paths
+class Metrics:
+    # Wrappers are installed on the instance only while enabled, so a disabled
+    # system runs the plain class methods with no extra work
+    OPERATIONS = (
+        'add_book', 'delete_book', 'update_book',
+        'search_book_by_isbn', 'search_books_by_title', 'search_books_by_author',
+        'borrow_book', 'return_book', 'undo', 'redo',
+        'get_user_borrowed_books', 'get_overdue_books', 'get_most_borrowed_books',
+    )
+    
+    def __init__(self, lms):
+        self.lms = lms
+        self.enabled = False
+        self.patched = []  # (object, attribute name) pairs to restore on disable
+        self.reset()
+    
+    def reset(self):
+        self.latencies = {}  # operation: LatencyHistogram
+        self.node_visits = {}  # traversal: total nodes visited
+        self.traversals = {}  # traversal: number of traversals
+    
+    def enable(self):
+        if self.enabled:
+            return
+        for name in self.OPERATIONS:
+            self._patch(self.lms, name, self._timed(name, getattr(self.lms, name)))
+        inventory = self.lms.inventory
+        self._patch(inventory, 'find_book', self._timed('find_book', self._counted_find_book(inventory)))
+        for tree in (self.lms.isbn_search_tree, self.lms.title_search_tree, self.lms.author_search_tree):
+            self._patch(tree, 'search', self._counted_search(tree))
+            self._patch(tree, 'search_by_prefix', self._counted_search_by_prefix(tree))
+        self.enabled = True
+    
+    def disable(self):
+        for obj, name in self.patched:
+            delattr(obj, name)
+        self.patched = []
+        self.enabled = False
+    
+    def _patch(self, obj, name, wrapper):
+        setattr(obj, name, wrapper)
+        self.patched.append((obj, name))
+    
+    def _timed(self, name, func):
+        # Look the histogram up on every call so reset() while enabled keeps recording
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter_ns() - start
+                histogram = self.latencies.get(name)
+                if histogram is None:
+                    histogram = self.latencies[name] = LatencyHistogram()
+                histogram.record(elapsed)
+        return wrapper
+    
+    def _count_visits(self, traversal, visits):
+        self.node_visits[traversal] = self.node_visits.get(traversal, 0) + visits
+        self.traversals[traversal] = self.traversals.get(traversal, 0) + 1
+    
+    def _counted_find_book(self, inventory):
+        def find_book(isbn):
+            node = inventory.nodes.get(isbn)
+            self._count_visits('inventory.find_book', 1 if node else 0)
+            return node.book if node else None
+        return find_book
+    
+    def _counted_search(self, tree):
+        traversal = f"{tree.key_type}_tree.search"
+        def search(key):
+            key = key.lower() if tree.key_type != 'isbn' else key
+            visits = 0
+            node = tree.root
+            while node and node.key[0] != key:
+                visits += 1
+                node = node.left if key < node.key[0] else node.right
+            self._count_visits(traversal, visits + 1 if node else visits)
+            return node.book if node else None
+        return search
+    
+    def _counted_search_by_prefix(self, tree):
+        traversal = f"{tree.key_type}_tree.search_by_prefix"
+        def search_by_prefix(prefix):
+            prefix = prefix.lower()
+            results = []
+            visits = 0
+            stack = [tree.root]
+            # Same pruning as BookSearchTree._search_by_prefix, pre-order like the recursion
+            while stack:
+                node = stack.pop()
+                if not node:
+                    continue
+                visits += 1
+                if node.key[0].startswith(prefix):
+                    results.append(node.book)
+                    stack.append(node.right)
+                    stack.append(node.left)
+                elif prefix < node.key[0]:
+                    stack.append(node.left)
+                else:
+                    stack.append(node.right)
+            self._count_visits(traversal, visits)
+            return results
+        return search_by_prefix
+    
+    def to_dict(self):
+        return {
+            'enabled': self.enabled,
+            'operations': {name: h.to_dict() for name, h in self.latencies.items() if h.count},
+            'node_visits': {
+                name: {
+                    'traversals': self.traversals[name],
+                    'nodes_visited': visits,
+                    'mean_nodes': round(visits / self.traversals[name], 2),
+                }
+                for name, visits in self.node_visits.items()
+            },
+        }
+    
+    def to_json(self, indent=2):
+        return json.dumps(self.to_dict(), indent=indent)
+    
+    def dump(self, path):
+        with open(path, 'w') as f:
+            f.write(self.to_json())
+
+# Days before the due date when a reminder is sent
+REMINDER_DAYS = 2
+
+# Fines are kept in cents to avoid rounding errors
+FINE_PER_DAY = 25
+FINE_THRESHOLD = 1000  # balance above which a user is reported
+
+# Fine account of one user
+# balance(today) = settled + rate * (open_loans * today - due_sum)
+class FineAccount:
+    def __init__(self):
+        self.settled = 0  # fines charged on returned loans, less payments
+        self.open_loans = 0  # overdue loans still out
+        self.due_sum = 0  # sum of their due-date ordinals
+        self.event = None  # pending threshold-crossing TimerEvent
+
+# Fine Engine: overdue loans accrue without a daily pass over every loan
+class FineEngine:
+    def __init__(self, scheduler, rate=FINE_PER_DAY, threshold=FINE_THRESHOLD):
+        self.scheduler = scheduler
+        self.rate = rate
+        self.threshold = threshold
+        self.accounts = {}  # user_id: FineAccount
+        self.settled = 0  # library-wide totals of the account fields
+        self.open_loans = 0
+        self.due_sum = 0
+        self.over_threshold = set()  # user_ids whose balance is above the threshold
+    
+    def _balance(self, settled, open_loans, due_sum):
+        return settled + self.rate * (open_loans * self.scheduler.current - due_sum)
+    
+    def start_accruing(self, user_id, due_date):
+        account = self.accounts.setdefault(user_id, FineAccount())
+        due = due_date.toordinal()
+        account.open_loans += 1
+        account.due_sum += due
+        self.open_loans += 1
+        self.due_sum += due
+        self._refresh(user_id, account)
+    
+    def stop_accruing(self, user_id, due_date, settle=True):
+        # Returns the fine charged for the loan; undoing a borrow charges nothing
+        account = self.accounts.get(user_id)
+        if not account:
+            return 0
+        due = due_date.toordinal()
+        account.open_loans -= 1
+        account.due_sum -= due
+        self.open_loans -= 1
+        self.due_sum -= due
+        fine = self.rate * (self.scheduler.current - due) if settle else 0
+        account.settled += fine
+        self.settled += fine
+        self._refresh(user_id, account)
+        return fine
+    
+    def adjust(self, user_id, amount):
+        # Charge (positive) or credit (negative) a user's settled balance
+        account = self.accounts.setdefault(user_id, FineAccount())
+        account.settled += amount
+        self.settled += amount
+        self._refresh(user_id, account)
+    
+    def get_balance(self, user_id):
+        account = self.accounts.get(user_id)
+        if not account:
+            return 0
+        return self._balance(account.settled, account.open_loans, account.due_sum)
+    
+    def get_total_outstanding(self):
+        return self._balance(self.settled, self.open_loans, self.due_sum)
+    
+    def get_users_over_threshold(self):
+        return sorted(((user_id, self.get_balance(user_id)) for user_id in self.over_threshold),
+                      key=lambda x: x[1], reverse=True)
+    
+    def _refresh(self, user_id, account):
+        if account.event:
+            self.scheduler.cancel(account.event)
+            account.event = None
+        balance = self._balance(account.settled, account.open_loans, account.due_sum)
+        if balance > self.threshold:
+            self.over_threshold.add(user_id)
+            return
+        self.over_threshold.discard(user_id)
+        if account.open_loans:
+            # The balance grows by rate * open_loans a day, so wake up on the day it crosses
+            days = (self.threshold - balance) // (self.rate * account.open_loans) + 1
+            account.event = self.scheduler.schedule(self.scheduler.current + days, self._on_crossing, user_id)
+        elif not account.settled:
+            del self.accounts[user_id]
+    
+    def _on_crossing(self, event):
+        account = self.accounts.get(event.data)
+        if account:
+            account.event = None
+            self._refresh(event.data, account)
 
 # Library Management System
 class LibraryManagementSystem:
@@ -213,6 +1311,19 @@ class LibraryManagementSystem:
         self.user_manager = UserManager()
         self.undo_stack = deque()
         self.redo_stack = deque()
+        self.hold_queue = HoldQueue()
+        self.loans = LoanTable()
+        self.copies = CopyStore()
+        self.query_cache = QueryCache()
+        self.catalog_version = 0  # bumped when books are added, updated or deleted
+        self.loan_version = 0  # bumped when any loan is created or removed
+        self.loan_listeners = []  # told about every loan created or removed (loan_added / loan_removed)
+        self.scheduler = TimingWheel(datetime.date.today().toordinal())
+        self.notifications = deque(maxlen=1000)  # (kind, user_id, isbn, due_date)
+        self.fines = FineEngine(self.scheduler)
+        self.metrics = Metrics(self)
+        if os.environ.get("LMS_METRICS"):
+            self.metrics.enable()
     
     # Book Management
     def add_book(self, isbn, title, author, quantity):
@@ -221,9 +1332,11 @@ class LibraryManagementSystem:
         
         book = Book(isbn, title, author, quantity)
         self.inventory.add_book(book)
+        self.copies.add_copies(isbn, quantity)
         self.isbn_search_tree.insert(book)
         self.title_search_tree.insert(book)
         self.author_search_tree.insert(book)
+        self.catalog_version += 1
         return True, "Book added successfully."
     
     def delete_book(self, isbn):
@@ -236,6 +1349,12 @@ class LibraryManagementSystem:
         
         success = self.inventory.delete_book(isbn)
         if success:
+            self.isbn_search_tree.remove(book)
+            self.title_search_tree.remove(book)
+            self.author_search_tree.remove(book)
+            self.copies.withdraw(isbn, book.quantity)
+            self.hold_queue.cancel_book(isbn)
+            self.catalog_version += 1
             return True, "Book deleted successfully."
         else:
             return False, "Failed to delete book."
@@ -250,38 +1369,92 @@ class LibraryManagementSystem:
         if quantity is not None:
             if quantity < borrowed_count:
                 return False, f"Cannot reduce quantity below {borrowed_count} as these copies are borrowed."
+            if quantity > book.quantity:
+                self.copies.add_copies(isbn, quantity - book.quantity)
+            else:
+                self.copies.withdraw(isbn, book.quantity - quantity)
             book.available += (quantity - book.quantity)
             book.quantity = quantity
         
         if title:
+            # Re-key the tree so searches and range scans see the new title
+            self.title_search_tree.remove(book)
             book.title = title
+            self.title_search_tree.insert(book)
         if author:
+            self.author_search_tree.remove(book)
             book.author = author
+            self.author_search_tree.insert(book)
+        self.catalog_version += 1
         
+        assigned = self._serve_holds(book)
+        if assigned:
+            self.redo_stack.clear()
+            return True, f"Book updated successfully. Copies assigned to holds: {', '.join(assigned)}"
         return True, "Book updated successfully."
     
     def get_all_books(self):
         return self.inventory.get_all_books()
     
+    def get_books_page(self, limit=50, token=None):
+        return self.inventory.get_books_page(limit, token)
+    
     # Search Functions
     def search_book_by_isbn(self, isbn):
         return self.isbn_search_tree.search(isbn)
     
     def search_books_by_title(self, title):
-        return self.title_search_tree.search_by_prefix(title)
+        return self._cached_query(
+            ('title', title.lower()), self.catalog_version,
+            lambda: self.title_search_tree.search_by_prefix(title))
     
     def search_books_by_author(self, author):
-        return self.author_search_tree.search_by_prefix(author)
+        return self._cached_query(
+            ('author', author.lower()), self.catalog_version,
+            lambda: self.author_search_tree.search_by_prefix(author))
+    
+    def browse_books_by_isbn(self, start=None, end=None, limit=20, cursor=None):
+        return self.isbn_search_tree.page(start, end, limit, cursor)
+    
+    def browse_books_by_title(self, start=None, end=None, limit=20, cursor=None):
+        return self.title_search_tree.page(start, end, limit, cursor)
+    
+    def browse_isbn_block(self, prefix, limit=20, cursor=None):
+        start, end = self.isbn_search_tree.prefix_range(prefix)
+        return self.isbn_search_tree.page(start, end, limit, cursor)
+    
+    def _cached_query(self, key, version, compute):
+        result = self.query_cache.get(key, version)
+        if result is None:
+            result = compute()
+            self.query_cache.put(key, version, result)
+        # Hand out a copy so callers cannot change the cached list
+        return list(result)
+    
+    def get_cache_stats(self):
+        return self.query_cache.get_stats()
     
     # User Management
     def register_user(self, user_id, name, email):
+        if self.user_manager.is_email_taken(email):
+            return False, "Email is already registered."
+        
         user = User(user_id, name, email)
         if self.user_manager.add_user(user):
             return True, "User registered successfully."
         else:
             return False, "User ID already exists."
     
+    def register_user_copy(self, user_id, name, email):
+        # Copy of a user owned by another shard; the router has already checked the email
+        if self.user_manager.get_user(user_id):
+            return True
+        return self.user_manager.add_user(User(user_id, name, email), check_email=False)
+    
     def update_user(self, user_id, name=None, email=None):
+        if email and self.user_manager.is_email_taken(email, user_id):
+            return False, "Email is already registered."
+        
         success = self.user_manager.update_user(user_id, name, email)
         if success:
             return True, "User updated successfully."
@@ -298,15 +1471,34 @@ class LibraryManagementSystem:
         
         success = self.user_manager.delete_user(user_id)
         if success:
+            self.hold_queue.cancel_user(user_id)
             return True, "User deleted successfully."
         else:
             return False, "Failed to delete user."
     
+    def get_user(self, user_id):
+        return self.user_manager.get_user(user_id)
+    
     def get_all_users(self):
         return self.user_manager.get_all_users()
     
+    def get_users_page(self, limit=50, token=None):
+        return self.user_manager.get_users_page(limit, token)
+    
+    def find_user_by_email(self, email):
+        return self.user_manager.find_by_email(email)
+    
+    def find_users_by_name(self, name):
+        return self.user_manager.find_by_name(name)
+    
+    def search_users_by_name(self, prefix, limit=None):
+        return self.user_manager.search_by_name_prefix(prefix, limit)
+    
+    def search_users_by_email(self, prefix, limit=None):
+        return self.user_manager.search_by_email_prefix(prefix, limit)
+    
     # Borrow/Return Functions
-    def borrow_book(self, user_id, isbn, days=14):
+    def borrow_book(self, user_id, isbn, days=14, barcode=None):
         user = self.user_manager.get_user(user_id)
         if not user:
             return False, "User not found."
@@ -318,18 +1510,77 @@ class LibraryManagementSystem:
         if book.available <= 0:
             return False, "No copies of this book available."
         
-        if isbn in user.borrowed_books:
+        if self.loans.get(user_id, isbn):
             return False, "User has already borrowed this book."
         
-        due_date = datetime.date.today() + datetime.timedelta(days=days)
-        book.available -= 1
-        book.borrowers[user_id] = due_date
-        user.borrowed_books[isbn] = due_date
-        
-        self.undo_stack.append(Action('borrow', user_id, isbn, due_date))
+        if barcode is not None:
+            if not self.copies.is_valid(barcode) or self.copies.get_isbn(barcode) != isbn:
+                return False, "Copy barcode does not belong to this book."
+            if self.copies.get_state(barcode) != COPY_AVAILABLE:
+                return False, "This copy is not available."
+        
+        # Copies freed by an undone hold checkout stay reserved for the holds in line
+        hold = None
+        if self.hold_queue.queue_length(isbn) >= book.available:
+            head = self.hold_queue.peek(isbn)
+            if head and head.user_id != user_id:
+                return False, "All available copies are reserved for users with holds."
+            if head:
+                hold = self.hold_queue.dequeue(isbn)
+        
+        checkout = self._checkout(user, book, days, barcode, hold=hold)
+        if not checkout:
+            if hold:
+                self.hold_queue.restore(hold)
+            return False, "No copies of this book available."
+        due_date, barcode = checkout
         self.redo_stack.clear()
         
-        return True, f"Book borrowed successfully. Due date: {due_date}"
+        return True, f"Book borrowed successfully. Copy: {barcode}, Due date: {due_date}"
+    
+    def _checkout(self, user, book, days=14, barcode=None, hold=None):
+        due_date = datetime.date.today() + datetime.timedelta(days=days)
+        barcode = self._add_loan(user, book, due_date, barcode)
+        if barcode is None:
+            return None
+        self.undo_stack.append(Action('borrow', user.user_id, book.isbn, due_date, barcode, hold=hold))
+        return due_date, barcode
+    
+    def _add_loan(self, user, book, due_date, barcode=None):
+        # Prefer the requested copy, otherwise take any free copy in O(1); None if no copy is free
+        if barcode is None or not self.copies.is_valid(barcode) or \
+                self.copies.get_isbn(barcode) != book.isbn or not self.copies.checkout(barcode):
+            barcode = self.copies.find_free_copy(book.isbn)
+            if barcode == -1:
+                return None
+            self.copies.checkout(barcode)
+        self.loan_version += 1
+        book.available -= 1
+        book.borrowers[user.user_id] = due_date
+        user.borrowed_books[book.isbn] = due_date
+        loan = Loan(user.user_id, book, due_date, barcode)
+        self.loans.add(loan)
+        self._schedule_loan_events(loan)
+        for listener in self.loan_listeners:
+            listener.loan_added(loan)
+        return barcode
+    
+    def _remove_loan(self, user, book, settle=True):
+        self.advance_clock()
+        loan = self.loans.remove(user.user_id, book.isbn)
+        if loan:
+            self.loan_version += 1
+            book.available += 1
+            book.borrowers.pop(user.user_id, None)
+            user.borrowed_books.pop(book.isbn, None)
+            self.copies.checkin(loan.barcode)
+            for event in loan.events:
+                self.scheduler.cancel(event)
+            if loan.overdue:
+                loan.fine = self.fines.stop_accruing(user.user_id, loan.due_date, settle)
+            for listener in self.loan_listeners:
+                listener.loan_removed(loan)
+        return loan
     
     def return_book(self, user_id, isbn):
         user = self.user_manager.get_user(user_id)
@@ -340,38 +1591,190 @@ class LibraryManagementSystem:
         if not book:
             return False, "Book not found."
         
-        if isbn not in user.borrowed_books:
+        if not self.loans.get(user_id, isbn):
             return False, "User hasn't borrowed this book."
         
-        due_date = user.borrowed_books[isbn]
-        book.available += 1
-        if user_id in book.borrowers:
-            del book.borrowers[user_id]
-        del user.borrowed_books[isbn]
+        loan = self._remove_loan(user, book)
         
-        self.undo_stack.append(Action('return', user_id, isbn, due_date))
+        self.undo_stack.append(Action('return', user_id, isbn, loan.due_date, loan.barcode, loan.fine))
         self.redo_stack.clear()
         
-        return True, "Book returned successfully."
+        message = "Book returned successfully."
+        if loan.fine:
+            message += f" Fine charged: ${loan.fine / 100:.2f}."
+        assigned = self._serve_holds(book)
+        if assigned:
+            message += f" Copy assigned to hold for user {assigned[0]}."
+        return True, message
+    
+    def return_copy(self, barcode):
+        loan = self.loans.get_by_barcode(barcode)
+        if not loan:
+            return False, "This copy is not on loan."
+        return self.return_book(loan.user_id, loan.isbn)
+    
+    # Fine Functions (amounts in cents)
+    def get_fine_balance(self, user_id):
+        self.advance_clock()
+        return self.fines.get_balance(user_id)
+    
+    def pay_fine(self, user_id, amount):
+        if not self.user_manager.get_user(user_id):
+            return False, "User not found."
+        if amount <= 0:
+            return False, "Payment must be positive."
+        balance = self.get_fine_balance(user_id)
+        if amount > balance:
+            return False, f"Payment exceeds the outstanding balance of ${balance / 100:.2f}."
+        self.fines.adjust(user_id, -amount)
+        return True, f"Payment recorded. Remaining balance: ${(balance - amount) / 100:.2f}"
+    
+    def get_total_outstanding_fines(self):
+        self.advance_clock()
+        return self.fines.get_total_outstanding()
+    
+    def get_users_over_fine_threshold(self):
+        self.advance_clock()
+        users = []
+        for user_id, balance in self.fines.get_users_over_threshold():
+            user = self.user_manager.get_user(user_id)
+            if user:
+                users.append((user, balance))
+        return users
+    
+    # Hold Functions
+    def place_hold(self, user_id, isbn, priority='general'):
+        if priority not in HOLD_PRIORITIES:
+            return False, "Invalid hold priority."
+        
+        user = self.user_manager.get_user(user_id)
+        if not user:
+            return False, "User not found."
+        
+        book = self.inventory.find_book(isbn)
+        if not book:
+            return False, "Book not found."
+        
+        if self.loans.get(user_id, isbn):
+            return False, "User has already borrowed this book."
+        
+        if book.available > 0:
+            return False, "Copies are available; borrow the book instead."
+        
+        if not self.hold_queue.enqueue(user_id, isbn, HOLD_PRIORITIES[priority]):
+            return False, "User already has a hold on this book."
+        
+        waiting = self.hold_queue.queue_length(isbn)
+        return True, f"Hold placed successfully ({priority}). Holds waiting: {waiting}"
+    
+    def upgrade_hold(self, user_id, isbn, priority):
+        if priority not in HOLD_PRIORITIES:
+            return False, "Invalid hold priority."
+        
+        if not self.hold_queue.has_hold(user_id, isbn):
+            return False, "No hold found for this user and book."
+        
+        if self.hold_queue.upgrade(user_id, isbn, HOLD_PRIORITIES[priority]):
+            return True, f"Hold upgraded to {priority}."
+        return False, "Hold already has this priority or higher."
+    
+    def cancel_hold(self, user_id, isbn):
+        if self.hold_queue.cancel(user_id, isbn):
+            return True, "Hold cancelled successfully."
+        return False, "No hold found for this user and book."
+    
+    def _serve_holds(self, book):
+        # Hand free copies to waiting users in FIFO order
+        assigned = []
+        while book.available > 0:
+            hold = self.hold_queue.dequeue(book.isbn)
+            if not hold:
+                break
+            user = self.user_manager.get_user(hold.user_id)
+            if not user or self.loans.get(user.user_id, book.isbn):
+                continue
+            if not self._checkout(user, book, hold=hold):
+                self.hold_queue.restore(hold)
+                break
+            assigned.append(user.user_id)
+        return assigned
+    
+    def get_hold_queue_lengths(self):
+        report = []
+        for isbn, length in self.hold_queue.get_queue_lengths().items():
+            book = self.inventory.find_book(isbn)
+            if book:
+                report.append((book, length))
+        report.sort(key=lambda x: x[1], reverse=True)
+        return report
     
     def get_user_borrowed_books(self, user_id):
         user = self.user_manager.get_user(user_id)
         if not user:
             return None, "User not found."
         
-        if not user.borrowed_books:
+        loans = self.loans.get_user_loans(user_id)
+        if not loans:
             return [], "User has no borrowed books."
         
-        today = datetime.date.today()
+        self.advance_clock()
         borrowed_books = []
-        for isbn, due_date in user.borrowed_books.items():
-            book = self.inventory.find_book(isbn)
-            status = "OVERDUE" if due_date < today else "On Time"
-            borrowed_books.append((book, due_date, status))
+        for loan in loans:
+            status = "OVERDUE" if loan.overdue else "On Time"
+            borrowed_books.append((loan.book, loan.due_date, status))
         
         return borrowed_books, None
     
+    # Due-date Scheduling
+    def _schedule_loan_events(self, loan):
+        due = loan.due_date.toordinal()
+        loan.events = []
+        if due - REMINDER_DAYS > self.scheduler.current:
+            loan.events.append(self.scheduler.schedule(due - REMINDER_DAYS, self._on_due_soon, loan))
+        if due > self.scheduler.current:
+            loan.events.append(self.scheduler.schedule(due, self._on_due, loan))
+        # A loan is overdue the day after its due date
+        loan.events.append(self.scheduler.schedule(due + 1, self._on_overdue, loan))
+    
+    def _notify(self, kind, loan):
+        self.notifications.append((kind, loan.user_id, loan.isbn, loan.due_date))
+    
+    def _on_due_soon(self, event):
+        self._notify('due_soon', event.data)
+    
+    def _on_due(self, event):
+        self._notify('due', event.data)
+    
+    def _on_overdue(self, event):
+        loan = event.data
+        loan.overdue = True
+        self.loan_version += 1
+        self.fines.start_accruing(loan.user_id, loan.due_date)
+        self._notify('overdue', loan)
+    
+    def advance_clock(self, today=None):
+        # Cheap when the date has not changed; otherwise fires only the events that are due
+        today = today or datetime.date.today()
+        return self.scheduler.advance(today.toordinal())
+    
+    def get_notifications(self):
+        self.advance_clock()
+        notifications = list(self.notifications)
+        self.notifications.clear()
+        return notifications
+    
+    def get_book_borrowers(self, isbn):
+        borrowers = []
+        for loan in self.loans.get_book_loans(isbn):
+            user = self.user_manager.get_user(loan.user_id)
+            if user:
+                borrowers.append((user, loan.due_date))
+        return borrowers
+    
     # Undo/Redo Functions
+    def get_undo_depth(self):
+        return len(self.undo_stack)
+    
     def undo(self):
         if not self.undo_stack:
             return False, "Nothing to undo."
@@ -386,16 +1789,22 @@ class LibraryManagementSystem:
             return False, "Undo failed: User or Book not found."
         
         if action.action_type == 'borrow':
-            book.available += 1
-            book.borrowers.pop(action.user_id, None)
-            user.borrowed_books.pop(action.isbn, None)
+            if not self._remove_loan(user, book, settle=False):
+                return False, "Undo failed: Book is not on loan."
+            if action.hold:
+                # Serving holds now would only hand the copy straight back to this hold
+                self.hold_queue.restore(action.hold)
+            elif self._serve_holds(book):
+                self.redo_stack.clear()  # the copy has gone to a hold, a new action
             return True, f"Undo: Book '{book.title}' returned by {user.name}"
         else:
             if book.available <= 0:
                 return False, "Undo failed: No available copies to borrow again."
-            book.available -= 1
-            book.borrowers[action.user_id] = action.due_date
-            user.borrowed_books[action.isbn] = action.due_date
+            # The reopened loan accrues again from its due date, so drop the fine charged on return
+            if self._add_loan(user, book, action.due_date, action.barcode) is None:
+                return False, "Undo failed: No available copies to borrow again."
+            if action.fine:
+                self.fines.adjust(user.user_id, -action.fine)
             return True, f"Undo: Book '{book.title}' borrowed again by {user.name}"
     
     def redo(self):
@@ -412,36 +1821,47 @@ class LibraryManagementSystem:
             return False, "Redo failed: User or Book not found."
         
         if action.action_type == 'borrow':
-            if book.available <= 0:
+            if book.available <= 0 or self._add_loan(user, book, action.due_date, action.barcode) is None:
                 return False, "Redo failed: No copies available to borrow."
-            book.available -= 1
-            book.borrowers[action.user_id] = action.due_date
-            user.borrowed_books[action.isbn] = action.due_date
+            if action.hold:
+                self.hold_queue.cancel(user.user_id, book.isbn)
             return True, f"Redo: Book '{book.title}' borrowed by {user.name}"
         else:
-            book.available += 1
-            book.borrowers.pop(action.user_id, None)
-            user.borrowed_books.pop(action.isbn, None)
+            loan = self._remove_loan(user, book)
+            if not loan:
+                return False, "Redo failed: Book is not on loan."
+            action.fine = loan.fine
+            if self._serve_holds(book):
+                self.redo_stack.clear()
             return True, f"Redo: Book '{book.title}' returned by {user.name}"
     
     # Reports
     def get_overdue_books(self):
         today = datetime.date.today()
+        self.advance_clock(today)
+        return self._cached_query(
+            ('overdue', today), (self.catalog_version, self.loan_version),
+            lambda: self._compute_overdue_books(today))
+    
+    def _compute_overdue_books(self, today):
+        # Loans due before today are exactly those the scheduler has marked overdue,
+        # and the due-date buckets already come back in due-date order
         overdue_books = []
         
-        current = self.inventory.head
-        while current:
-            for user_id, due_date in current.book.borrowers.items():
-                if due_date < today:
-                    user = self.user_manager.get_user(user_id)
-                    if user:
-                        overdue_days = (today - due_date).days
-                        overdue_books.append((current.book, user, due_date, overdue_days))
-            current = current.next
+        for loan in self.loans.get_due_before(today):
+            user = self.user_manager.get_user(loan.user_id)
+            if user:
+                overdue_days = (today - loan.due_date).days
+                overdue_books.append((loan.book, user, loan.due_date, overdue_days))
         
         return overdue_books
     
     def get_most_borrowed_books(self, top_n=5):
+        return self._cached_query(
+            ('most_borrowed', top_n), (self.catalog_version, self.loan_version),
+            lambda: self._compute_most_borrowed_books(top_n))
+    
+    def _compute_most_borrowed_books(self, top_n):
         book_borrow_counts = []
         
         current = self.inventory.head
@@ -453,8 +1873,705 @@ class LibraryManagementSystem:
         book_borrow_counts.sort(key=lambda x: x[1], reverse=True)
         return book_borrow_counts[:top_n]
 
+# Shard worker loop, run in a separate process by ProcessShard
+def _run_shard(conn):
+    lms = LibraryManagementSystem()
+    while True:
+        request = conn.recv()
+        if request is None:
+            break
+        method, args, kwargs = request
+        try:
+            conn.send((True, getattr(lms, method)(*args, **kwargs)))
+        except Exception as e:
+            conn.send((False, e))
+    conn.close()
+
+# Shard holding its LibraryManagementSystem in the current process
+class LocalShard:
+    def __init__(self):
+        self.lms = LibraryManagementSystem()
+        self.pending = None
+    
+    def send(self, method, *args, **kwargs):
+        self.pending = (method, args, kwargs)
+    
+    def receive(self):
+        method, args, kwargs = self.pending
+        self.pending = None
+        return getattr(self.lms, method)(*args, **kwargs)
+    
+    def call(self, method, *args, **kwargs):
+        self.send(method, *args, **kwargs)
+        return self.receive()
+    
+    def close(self):
+        pass
+
+# Shard holding its LibraryManagementSystem in a child process
+class ProcessShard:
+    def __init__(self):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_run_shard, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+    
+    def send(self, method, *args, **kwargs):
+        self.conn.send((method, args, kwargs))
+    
+    def receive(self):
+        success, result = self.conn.recv()
+        if not success:
+            raise result
+        return result
+    
+    def call(self, method, *args, **kwargs):
+        self.send(method, *args, **kwargs)
+        return self.receive()
+    
+    def close(self):
+        if self.process.is_alive():
+            self.conn.send(None)
+            self.process.join()
+        self.conn.close()
+
+# Library split across shards: books by hash of ISBN, users by hash of user ID
+class ShardedLibrary:
+    def __init__(self, num_shards=4, use_processes=False):
+        shard_class = ProcessShard if use_processes else LocalShard
+        self.shards = [shard_class() for _ in range(num_shards)]
+        self.undo_history = deque()  # shard index of each undoable action
+        self.redo_history = deque()
+        self.undo_depths = [0] * num_shards  # last known undo stack size per shard
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def close(self):
+        for shard in self.shards:
+            shard.close()
+    
+    def shard_index(self, key):
+        # crc32 rather than hash() so every process maps a key to the same shard
+        return zlib.crc32(key.encode('utf-8')) % len(self.shards)
+    
+    def _fan_out(self, method, *args, **kwargs):
+        # Send to every shard first so process shards work in parallel
+        for shard in self.shards:
+            shard.send(method, *args, **kwargs)
+        return [shard.receive() for shard in self.shards]
+    
+    def _book_call(self, isbn, method, *args, **kwargs):
+        return self.shards[self.shard_index(isbn)].call(method, isbn, *args, **kwargs)
+    
+    def _record(self, index):
+        depth = self.shards[index].call('get_undo_depth')
+        if depth > self.undo_depths[index]:
+            self.undo_history.extend([index] * (depth - self.undo_depths[index]))
+            self.redo_history.clear()
+        self.undo_depths[index] = depth
+    
+    def _ensure_user(self, user_id, index):
+        # Books and users may live on different shards; the book's shard keeps a copy of the user
+        user = self.get_user(user_id)
+        if not user:
+            return False
+        if index != self.shard_index(user_id):
+            return self.shards[index].call('register_user_copy', user.user_id, user.name, user.email)
+        return True
+    
+    def _email_owner(self, email):
+        # Shards only see their own users, so email uniqueness is checked across all of them here
+        for user in self._fan_out('find_user_by_email', email):
+            if user:
+                return user.user_id
+        return None
+    
+    # Book Management
+    def add_book(self, isbn, title, author, quantity):
+        return self._book_call(isbn, 'add_book', title, author, quantity)
+    
+    def delete_book(self, isbn):
+        return self._book_call(isbn, 'delete_book')
+    
+    def update_book(self, isbn, title=None, author=None, quantity=None):
+        result = self._book_call(isbn, 'update_book', title, author, quantity)
+        self._record(self.shard_index(isbn))
+        return result
+    
+    def get_all_books(self):
+        return [book for books in self._fan_out('get_all_books') for book in books]
+    
+    # Search Functions
+    def search_book_by_isbn(self, isbn):
+        return self._book_call(isbn, 'search_book_by_isbn')
+    
+    def search_books_by_title(self, title):
+        results = self._fan_out('search_books_by_title', title)
+        return sorted((book for books in results for book in books), key=lambda book: book.title.lower())
+    
+    def search_books_by_author(self, author):
+        results = self._fan_out('search_books_by_author', author)
+        return sorted((book for books in results for book in books), key=lambda book: book.author.lower())
+    
+    # User Management
+    def register_user(self, user_id, name, email):
+        if self._email_owner(email) is not None:
+            return False, "Email is already registered."
+        return self.shards[self.shard_index(user_id)].call('register_user', user_id, name, email)
+    
+    def get_user(self, user_id):
+        return self.shards[self.shard_index(user_id)].call('get_user', user_id)
+    
+    def update_user(self, user_id, name=None, email=None):
+        if email and self._email_owner(email) not in (None, user_id):
+            return False, "Email is already registered."
+        results = self._fan_out('update_user', user_id, name, email)
+        return results[self.shard_index(user_id)]
+    
+    def delete_user(self, user_id):
+        copies = [user for user in self._fan_out('get_user', user_id) if user]
+        if not copies:
+            return False, "User not found."
+        
+        if any(user.borrowed_books for user in copies):
+            return False, "Cannot delete user with borrowed books."
+        
+        results = self._fan_out('delete_user', user_id)
+        return results[self.shard_index(user_id)]
+    
+    def get_all_users(self):
+        users = []
+        for index, shard_users in enumerate(self._fan_out('get_all_users')):
+            users.extend(user for user in shard_users if self.shard_index(user.user_id) == index)
+        return users
+    
+    # Borrow/Return Functions
+    def borrow_book(self, user_id, isbn, days=14, barcode=None):
+        index = self.shard_index(isbn)
+        if not self._ensure_user(user_id, index):
+            return False, "User not found."
+        
+        result = self.shards[index].call('borrow_book', user_id, isbn, days, barcode)
+        self._record(index)
+        return result
+    
+    def return_book(self, user_id, isbn):
+        index = self.shard_index(isbn)
+        result = self.shards[index].call('return_book', user_id, isbn)
+        self._record(index)
+        return result
+    
+    def get_user_borrowed_books(self, user_id):
+        if not self.get_user(user_id):
+            return None, "User not found."
+        
+        borrowed_books = []
+        for books, error in self._fan_out('get_user_borrowed_books', user_id):
+            if books:
+                borrowed_books.extend(books)
+        
+        if not borrowed_books:
+            return [], "User has no borrowed books."
+        return borrowed_books, None
+    
+    # Hold Functions
+    def place_hold(self, user_id, isbn, priority='general'):
+        index = self.shard_index(isbn)
+        if not self._ensure_user(user_id, index):
+            return False, "User not found."
+        return self.shards[index].call('place_hold', user_id, isbn, priority)
+    
+    def cancel_hold(self, user_id, isbn):
+        return self.shards[self.shard_index(isbn)].call('cancel_hold', user_id, isbn)
+    
+    # Fine Functions: a user's loans live on the shards of their books
+    def get_fine_balance(self, user_id):
+        return sum(self._fan_out('get_fine_balance', user_id))
+    
+    def get_total_outstanding_fines(self):
+        return sum(self._fan_out('get_total_outstanding_fines'))
+    
+    # Undo/Redo Functions
+    def undo(self):
+        if not self.undo_history:
+            return False, "Nothing to undo."
+        
+        index = self.undo_history.pop()
+        self.redo_history.append(index)
+        self.undo_depths[index] -= 1
+        result = self.shards[index].call('undo')
+        self._record(index)  # picks up copies handed to holds by the undo
+        return result
+    
+    def redo(self):
+        if not self.redo_history:
+            return False, "Nothing to redo."
+        
+        index = self.redo_history.pop()
+        self.undo_history.append(index)
+        self.undo_depths[index] += 1
+        result = self.shards[index].call('redo')
+        self._record(index)
+        return result
+    
+    # Reports
+    def get_overdue_books(self):
+        # Each shard reports in due-date order, so a k-way merge keeps that order
+        return list(heapq.merge(*self._fan_out('get_overdue_books'), key=lambda entry: entry[2]))
+    
+    def get_most_borrowed_books(self, top_n=5):
+        results = self._fan_out('get_most_borrowed_books', top_n)
+        return heapq.nlargest(top_n, (entry for entries in results for entry in entries), key=lambda x: x[1])
+    
+    def get_hold_queue_lengths(self):
+        results = self._fan_out('get_hold_queue_lengths')
+        return sorted((entry for entries in results for entry in entries), key=lambda x: x[1], reverse=True)
+
+# Parallel report workers: attach to a shared int32 column and scan one slice of it
+def _top_borrowed_chunk(shm_name, start, stop, top_n):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        counts = shm.buf.cast('i')
+        # Ties go to the lower position, matching the stable sort in get_most_borrowed_books
+        best = heapq.nlargest(top_n, ((counts[i], -i) for i in range(start, stop)))
+        del counts
+    finally:
+        shm.close()
+    return [(count, -neg_position) for count, neg_position in best]
+
+def _overdue_chunk(shm_name, start, stop, today_ordinal):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        due_ordinals = shm.buf.cast('i')
+        positions = [i for i in range(start, stop) if due_ordinals[i] < today_ordinal]
+        del due_ordinals
+    finally:
+        shm.close()
+    return positions
+
+# Report columns kept in shared memory and patched in place on every loan change,
+# so the parallel reports hand their workers data that is already shared
+class SharedReportColumns:
+    FREE_SLOT = 2 ** 31 - 1  # due ordinal of an empty loan slot, never overdue
+    
+    def __init__(self, lms):
+        self.lms = lms
+        self.books = []  # slot: Book, in inventory order
+        self.book_slots = {}  # isbn: slot
+        self.counts = None  # int32 borrow count per book slot
+        self.catalog_version = None  # catalog the book slots were built from
+        self.loans = []  # slot: Loan, or None once the slot is freed
+        self.loan_slots = {}  # Loan: slot
+        self.free_slots = []
+        self.capacity = 64
+        self.due_ordinals = self._allocate(self.capacity, self.FREE_SLOT)
+        self.sync_books()
+        for loans in lms.loans.by_user.values():
+            for loan in loans.values():
+                self._place(loan)
+        lms.loan_listeners.append(self)
+    
+    @staticmethod
+    def _allocate(size, fill):
+        shm = shared_memory.SharedMemory(create=True, size=4 * max(1, size))
+        view = shm.buf.cast('i')
+        view[:size] = array('i', [fill]) * size
+        del view
+        return shm
+    
+    @staticmethod
+    def _release(shm):
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+    
+    @staticmethod
+    def _set(shm, index, value):
+        view = shm.buf.cast('i')
+        view[index] = value
+        del view
+    
+    @staticmethod
+    def _add(shm, index, delta):
+        view = shm.buf.cast('i')
+        view[index] += delta
+        del view
+    
+    def sync_books(self):
+        # Book slots follow the inventory order, so they are rebuilt only when the catalog changes
+        if self.catalog_version == self.lms.catalog_version:
+            return
+        self.books = self.lms.get_all_books()
+        self.book_slots = {book.isbn: slot for slot, book in enumerate(self.books)}
+        self._release(self.counts)
+        self.counts = self._allocate(len(self.books), 0)
+        view = self.counts.buf.cast('i')
+        view[:len(self.books)] = array('i', (book.quantity - book.available for book in self.books))
+        del view
+        self.catalog_version = self.lms.catalog_version
+    
+    def _grow(self):
+        old = self.due_ordinals
+        self.due_ordinals = self._allocate(self.capacity * 2, self.FREE_SLOT)
+        view, old_view = self.due_ordinals.buf.cast('i'), old.buf.cast('i')
+        view[:self.capacity] = old_view[:self.capacity]
+        del view, old_view
+        self._release(old)
+        self.capacity *= 2
+    
+    def _place(self, loan):
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            slot = len(self.loans)
+            if slot == self.capacity:
+                self._grow()
+            self.loans.append(None)
+        self.loans[slot] = loan
+        self.loan_slots[loan] = slot
+        self._set(self.due_ordinals, slot, loan.due_date.toordinal())
+    
+    def loan_added(self, loan):
+        slot = self.book_slots.get(loan.isbn)
+        if slot is not None:
+            self._add(self.counts, slot, 1)
+        self._place(loan)
+    
+    def loan_removed(self, loan):
+        slot = self.book_slots.get(loan.isbn)
+        if slot is not None:
+            self._add(self.counts, slot, -1)
+        slot = self.loan_slots.pop(loan, None)
+        if slot is not None:
+            self._set(self.due_ordinals, slot, self.FREE_SLOT)
+            self.loans[slot] = None
+            self.free_slots.append(slot)
+    
+    def close(self):
+        if self in self.lms.loan_listeners:
+            self.lms.loan_listeners.remove(self)
+        self._release(self.counts)
+        self._release(self.due_ordinals)
+        self.counts = self.due_ordinals = None
+
+# Parallel Report Generation over a process pool
+class ParallelReports:
+    def __init__(self, lms, max_workers=None):
+        self.lms = lms
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self.columns = SharedReportColumns(lms)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def close(self):
+        self.executor.shutdown()
+        self.columns.close()
+    
+    def _partitions(self, size):
+        chunk = max(1, -(-size // self.max_workers))
+        return [(start, min(start + chunk, size)) for start in range(0, size, chunk)]
+    
+    def _scan(self, shm, size, worker, *args):
+        # Workers attach to the shared column by name; only slice bounds and results are pickled
+        futures = [
+            self.executor.submit(worker, shm.name, start, stop, *args)
+            for start, stop in self._partitions(size)
+        ]
+        return [future.result() for future in futures]
+    
+    def get_most_borrowed_books(self, top_n=5):
+        self.columns.sync_books()
+        books = self.columns.books
+        if not books or top_n <= 0:
+            return []
+        partials = self._scan(self.columns.counts, len(books), _top_borrowed_chunk, top_n)
+        best = heapq.nlargest(top_n, ((count, -position) for partial in partials for count, position in partial))
+        return [(books[-neg_position], count) for count, neg_position in best]
+    
+    def get_overdue_books(self):
+        loans = self.columns.loans
+        if not self.columns.loan_slots:
+            return []
+        today = datetime.date.today()
+        partials = self._scan(self.columns.due_ordinals, len(loans), _overdue_chunk, today.toordinal())
+        
+        overdue_books = []
+        for positions in partials:
+            for position in positions:
+                loan = loans[position]
+                user = self.lms.user_manager.get_user(loan.user_id)
+                if user:
+                    overdue_books.append((loan.book, user, loan.due_date, (today - loan.due_date).days))
+        overdue_books.sort(key=lambda entry: entry[2])
+        return overdue_books
+
+def benchmark_parallel_reports(num_books=20000, num_users=5000, max_workers=None, repeat=3):
+    lms = LibraryManagementSystem()
+    rng = random.Random(42)
+    book_ids = list(range(num_books))
+    rng.shuffle(book_ids)
+    for i in book_ids:
+        lms.add_book(f"978-{i:09d}", f"Title {i}", f"Author {i % 1000}", rng.randint(1, 5))
+    for i in range(num_users):
+        lms.register_user(f"U{i:06d}", f"User {i}", f"user{i}@example.com")
+    books = lms.get_all_books()
+    for i in range(num_users):
+        for book in rng.sample(books, 3):
+            if book.available > 0:
+                lms.borrow_book(f"U{i:06d}", book.isbn, rng.randint(-30, 30))
+    
+    def best_time(report):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            report()
+            times.append(time.perf_counter() - start)
+        return min(times)
+    
+    print(f"{num_books} books, {lms.loans.size} loans")
+    print(f"{'workers':>8} {'most borrowed':>14} {'overdue':>10}")
+    print(f"{'serial':>8} {best_time(lambda: lms.get_most_borrowed_books(10)):>13.3f}s "
+          f"{best_time(lms.get_overdue_books):>9.3f}s")
+    for workers in range(1, (max_workers or os.cpu_count() or 1) + 1):
+        with ParallelReports(lms, workers) as reports:
+            reports.get_most_borrowed_books(10)  # warm up the pool
+            print(f"{workers:>8} {best_time(lambda: reports.get_most_borrowed_books(10)):>13.3f}s "
+                  f"{best_time(reports.get_overdue_books):>9.3f}s")
+
+# Synthetic Data Generator for benchmarks
+BENCHMARK_WORDS = (
+    "algorithms", "art", "basics", "clean", "code", "compilers", "computer", "data",
+    "design", "distributed", "engineering", "functional", "graphs", "history",
+    "introduction", "learning", "machine", "networks", "patterns", "programming",
+    "python", "science", "structures", "systems", "theory",
+)
+
+def generate_library_data(num_books=5000, num_users=1000, num_loans=2000, distribution='random', seed=42):
+    # distribution: 'random' (shuffled ISBNs), 'sorted' (ascending ISBNs) or
+    # 'skewed' (shuffled ISBNs, loans concentrated on a few popular books)
+    rng = random.Random(seed)
+    isbns = [f"978-{i:09d}" for i in range(num_books)]
+    if distribution != 'sorted':
+        rng.shuffle(isbns)
+    
+    books = []
+    for i, isbn in enumerate(isbns):
+        title = f"{rng.choice(BENCHMARK_WORDS).title()} {rng.choice(BENCHMARK_WORDS)} {i}"
+        author = f"{rng.choice(BENCHMARK_WORDS).title()} Author{rng.randrange(num_books // 10 + 1)}"
+        books.append((isbn, title, author, rng.randint(1, 5)))
+    
+    users = [(f"U{i:07d}", f"User {i}", f"user{i}@example.com") for i in range(num_users)]
+    
+    loans = []
+    for _ in range(num_loans):
+        if distribution == 'skewed':
+            book_index = int(num_books * rng.random() ** 3)
+        else:
+            book_index = rng.randrange(num_books)
+        # Some loans start already overdue so the overdue report has work to do
+        loans.append((rng.choice(users)[0], isbns[book_index], rng.randint(-30, 30)))
+    return books, users, loans
+
+def _timed_phase(results, phase, ops, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    results.append({
+        'phase': phase,
+        'ops': ops,
+        'seconds': round(elapsed, 6),
+        'ops_per_sec': round(ops / elapsed, 1) if elapsed else None,
+    })
+
+def _load_library(books, users):
+    lms = LibraryManagementSystem()
+    for book in books:
+        lms.add_book(*book)
+    for user in users:
+        lms.register_user(*user)
+    return lms
+
+def run_benchmark(num_books=5000, num_users=1000, num_loans=2000, num_queries=1000,
+                  distribution='random', seed=42):
+    books, users, loans = generate_library_data(num_books, num_users, num_loans, distribution, seed)
+    rng = random.Random(seed + 1)
+    isbn_queries = [rng.choice(books)[0] for _ in range(num_queries)]
+    title_queries = [rng.choice(books)[1][:rng.randint(2, 8)] for _ in range(num_queries)]
+    author_queries = [rng.choice(books)[2][:rng.randint(2, 8)] for _ in range(num_queries)]
+    results = []
+    
+    lms = LibraryManagementSystem()
+    lms.query_cache.capacity = 0  # measure the engine, not the result cache
+    _timed_phase(results, 'add_book', len(books), lambda: [lms.add_book(*book) for book in books])
+    _timed_phase(results, 'register_user', len(users), lambda: [lms.register_user(*user) for user in users])
+    _timed_phase(results, 'find_book', num_queries, lambda: [lms.inventory.find_book(isbn) for isbn in isbn_queries])
+    _timed_phase(results, 'search_isbn', num_queries, lambda: [lms.search_book_by_isbn(isbn) for isbn in isbn_queries])
+    _timed_phase(results, 'search_title', num_queries, lambda: [lms.search_books_by_title(t) for t in title_queries])
+    _timed_phase(results, 'search_author', num_queries, lambda: [lms.search_books_by_author(a) for a in author_queries])
+    
+    borrowed = []
+    def borrow_all():
+        for user_id, isbn, days in loans:
+            if lms.borrow_book(user_id, isbn, days)[0]:
+                borrowed.append((user_id, isbn))
+    _timed_phase(results, 'borrow_book', len(loans), borrow_all)
+    _timed_phase(results, 'get_overdue_books', 10, lambda: [lms.get_overdue_books() for _ in range(10)])
+    _timed_phase(results, 'get_most_borrowed_books', 10, lambda: [lms.get_most_borrowed_books(10) for _ in range(10)])
+    _timed_phase(results, 'undo', len(borrowed), lambda: [lms.undo() for _ in borrowed])
+    _timed_phase(results, 'redo', len(borrowed), lambda: [lms.redo() for _ in borrowed])
+    _timed_phase(results, 'return_book', len(borrowed), lambda: [lms.return_book(u, i) for u, i in borrowed])
+    
+    # Memory is measured on a separate load because tracemalloc slows everything down
+    tracemalloc.start()
+    loaded = _load_library(books, users)
+    for user_id, isbn, days in loans:
+        loaded.borrow_book(user_id, isbn, days)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {
+        'config': {
+            'books': num_books, 'users': num_users, 'loans': num_loans,
+            'queries': num_queries, 'distribution': distribution, 'seed': seed,
+        },
+        'phases': results,
+        'memory': {'current_mb': round(current / 2 ** 20, 2), 'peak_mb': round(peak / 2 ** 20, 2)},
+    }
+
+def print_benchmark(report):
+    config = report['config']
+    print(f"=== {config['distribution']}: {config['books']} books, {config['users']} users, "
+          f"{config['loans']} loans, {config['queries']} queries ===")
+    print(f"{'phase':<26}{'ops':>9}{'seconds':>12}{'ops/sec':>14}")
+    for phase in report['phases']:
+        print(f"{phase['phase']:<26}{phase['ops']:>9}{phase['seconds']:>12.4f}{phase['ops_per_sec'] or 0:>14.1f}")
+    memory = report['memory']
+    print(f"memory: {memory['current_mb']} MB retained, {memory['peak_mb']} MB peak\n")
+
+def benchmark_main(argv):
+    parser = argparse.ArgumentParser(description="Library engine benchmark suite")
+    parser.add_argument('--benchmark', action='store_true')
+    parser.add_argument('--books', type=int, default=5000)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--loans', type=int, default=2000)
+    parser.add_argument('--queries', type=int, default=1000)
+    parser.add_argument('--distribution', choices=('random', 'sorted', 'skewed', 'all'), default='all')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help="also write the results to this file")
+    args = parser.parse_args(argv)
+    
+    distributions = ('random', 'sorted', 'skewed') if args.distribution == 'all' else (args.distribution,)
+    reports = []
+    for distribution in distributions:
+        report = run_benchmark(args.books, args.users, args.loans, args.queries, distribution, args.seed)
+        print_benchmark(report)
+        reports.append(report)
+    
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(reports, f, indent=2)
+
+# Sampling Profiler writing collapsed stacks ("a;b;c count") for flame graph tools
+class SamplingProfiler:
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.thread_id = threading.main_thread().ident
+        self.stacks = {}  # collapsed stack: sample count
+        self.callback_times = {}  # label: [calls, total seconds]
+        self.enabled = False
+        # (label, wrapper frame) of the outermost profiled call in progress, published as one
+        # tuple so the sampler never sees a label without its frame; frames above it belong to the Tk event loop
+        self.current = None
+        self.stop_event = threading.Event()
+        self.sampler = None
+        self.wrapper_codes = set()  # code objects of our wrappers, left out of stacks
+    
+    def start(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.stop_event.clear()
+        self.sampler = threading.Thread(target=self._sample_loop, daemon=True)
+        self.sampler.start()
+    
+    def stop(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        self.stop_event.set()
+        self.sampler.join()
+        self.sampler = None
+    
+    def reset(self):
+        self.stacks = {}
+        self.callback_times = {}
+    
+    def wrap(self, label, func):
+        def wrapper(*args, **kwargs):
+            if not self.enabled or self.current is not None:
+                return func(*args, **kwargs)
+            self.current = (label, sys._getframe())
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.current = None
+                stats = self.callback_times.setdefault(label, [0, 0.0])
+                stats[0] += 1
+                stats[1] += time.perf_counter() - start
+        self.wrapper_codes.add(wrapper.__code__)
+        return wrapper
+    
+    def _sample_loop(self):
+        while not self.stop_event.wait(self.interval):
+            current = self.current
+            frame = sys._current_frames().get(self.thread_id)
+            if current is None or frame is None:
+                continue
+            label, root = current
+            names = []
+            while frame is not None and frame is not root:
+                code = frame.f_code
+                if code not in self.wrapper_codes:
+                    names.append(f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if frame is None:
+                continue  # the call returned before the stack was captured
+            names.append(label)
+            stack = ";".join(reversed(names))
+            self.stacks[stack] = self.stacks.get(stack, 0) + 1
+    
+    def write_collapsed(self, path):
+        with open(path, 'w') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+    
+    def summary(self):
+        lines = []
+        for label, (calls, total) in sorted(self.callback_times.items(), key=lambda x: x[1][1], reverse=True):
+            lines.append(f"{label}: {calls} call(s), {total * 1000:.1f} ms")
+        return lines
+
 # GUI Application
 class LibraryApp(tk.Tk):
+    # Callbacks wrapped for profiling; engine calls show up beneath them in the stacks
+    PROFILED_CALLBACKS = (
+        'add_book', 'update_book_dialog', 'delete_book', 'refresh_book_list',
+        'register_user', 'update_user_dialog', 'delete_user', 'refresh_user_list',
+        'borrow_book', 'return_book', 'place_hold', 'update_borrowed_books',
+        'undo_action', 'redo_action', 'search_books',
+        'show_overdue_books', 'show_most_borrowed', 'show_hold_queues',
+    )
+    
     def __init__(self):
         super().__init__()
         self.lms = LibraryManagementSystem()
@@ -462,6 +2579,16 @@ class LibraryApp(tk.Tk):
         self.geometry("1000x700")
         self.configure(bg="#f0f0f0")
         
+        # Profiling (LMS_PROFILE=<output file> starts it right away)
+        self.profiler = SamplingProfiler()
+        self.profile_path = os.environ.get("LMS_PROFILE") or "lms_profile.collapsed"
+        for name in self.PROFILED_CALLBACKS:
+            setattr(self, name, self.profiler.wrap(f"gui:{name}", getattr(self, name)))
+        if os.environ.get("LMS_PROFILE"):
+            self.profiler.start()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self._create_menu()
+        
         # Add sample data
         self._add_sample_data()
         
@@ -520,6 +2647,9 @@ class LibraryApp(tk.Tk):
         
         # Set initial status
         self.update_status("Ready")
+        
+        # Poll the due-date scheduler for reminders
+        self.after(60000, self.check_reminders)
     
     def _add_sample_data(self):
         # Add sample books
@@ -535,6 +2665,43 @@ class LibraryApp(tk.Tk):
     def update_status(self, message):
         self.status_var.set(message)
     
+    def check_reminders(self):
+        notifications = self.lms.get_notifications()
+        if notifications:
+            overdue = sum(1 for kind, user_id, isbn, due_date in notifications if kind == 'overdue')
+            self.update_status(f"{len(notifications)} due-date reminder(s), {overdue} loan(s) now overdue.")
+            self.update_borrowed_books()
+        self.after(60000, self.check_reminders)
+    
+    def _create_menu(self):
+        menubar = tk.Menu(self)
+        profile_menu = tk.Menu(menubar, tearoff=0)
+        profile_menu.add_command(label="Start Profiling", command=self.start_profiling)
+        profile_menu.add_command(label="Stop and Save Profile", command=self.stop_profiling)
+        menubar.add_cascade(label="Profiling", menu=profile_menu)
+        self.config(menu=menubar)
+    
+    def start_profiling(self):
+        self.profiler.reset()
+        self.profiler.start()
+        self.update_status("Profiling started.")
+    
+    def stop_profiling(self):
+        if not self.profiler.enabled:
+            messagebox.showinfo("Profiling", "Profiling is not running.")
+            return
+        self.profiler.stop()
+        self.profiler.write_collapsed(self.profile_path)
+        self.update_status(f"Profile saved to {self.profile_path}")
+        summary = "\n".join(self.profiler.summary()) or "No callbacks were profiled."
+        messagebox.showinfo("Profiling", f"Collapsed stacks written to {self.profile_path}\n\n{summary}")
+    
+    def on_close(self):
+        if self.profiler.enabled:
+            self.profiler.stop()
+            self.profiler.write_collapsed(self.profile_path)
+        self.destroy()
+    
     def _create_book_tab(self):
         tab = ttk.Frame(self.notebook)
         self.notebook.add(tab, text="Book Management")
@@ -719,8 +2886,24 @@ class LibraryApp(tk.Tk):
         self.days_entry = ttk.Entry(borrow_frame)
         self.days_entry.grid(row=2, column=1, padx=5, pady=2)
         
+        ttk.Label(borrow_frame, text="Copy barcode (optional):").grid(row=3, column=0, sticky="e", padx=5, pady=2)
+        self.barcode_entry = ttk.Entry(borrow_frame)
+        self.barcode_entry.grid(row=3, column=1, padx=5, pady=2)
+        
         borrow_btn = ttk.Button(borrow_frame, text="Borrow Book", command=self.borrow_book)
-        borrow_btn.grid(row=3, column=0, columnspan=2, pady=5)
+        borrow_btn.grid(row=4, column=0, columnspan=2, pady=5)
+        
+        ttk.Label(borrow_frame, text="Hold priority:").grid(row=5, column=0, sticky="e", padx=5, pady=2)
+        self.hold_priority = tk.StringVar(value="general")
+        ttk.Combobox(
+            borrow_frame, 
+            textvariable=self.hold_priority, 
+            values=list(HOLD_PRIORITIES), 
+            state="readonly"
+        ).grid(row=5, column=1, padx=5, pady=2)
+        
+        hold_btn = ttk.Button(borrow_frame, text="Place Hold", command=self.place_hold)
+        hold_btn.grid(row=6, column=0, columnspan=2, pady=5)
         
         # Return form
         return_frame = ttk.Frame(br_frame)
@@ -859,6 +3042,18 @@ class LibraryApp(tk.Tk):
             command=self.show_most_borrowed
         ).pack(pady=5, fill="x")
         
+        ttk.Button(
+            reports_frame, 
+            text="Show Hold Queues", 
+            command=self.show_hold_queues
+        ).pack(pady=5, fill="x")
+        
+        ttk.Button(
+            reports_frame, 
+            text="Show Outstanding Fines", 
+            command=self.show_fines
+        ).pack(pady=5, fill="x")
+        
         # Report display
         self.report_text = scrolledtext.ScrolledText(
             reports_frame, 
@@ -1093,6 +3288,7 @@ class LibraryApp(tk.Tk):
         user_id = self.borrow_user_entry.get().strip()
         isbn = self.borrow_isbn_entry.get().strip()
         days = self.days_entry.get().strip()
+        barcode = self.barcode_entry.get().strip()
         
         if not all([user_id, isbn]):
             messagebox.showerror("Error", "User ID and ISBN are required!")
@@ -1105,7 +3301,14 @@ class LibraryApp(tk.Tk):
                 return
             days_int = int(days)
         
-        success, message = self.lms.borrow_book(user_id, isbn, days_int)
+        barcode_int = None
+        if barcode:
+            if not barcode.isdigit():
+                messagebox.showerror("Error", "Barcode must be a number!")
+                return
+            barcode_int = int(barcode)
+        
+        success, message = self.lms.borrow_book(user_id, isbn, days_int, barcode_int)
         if success:
             self.refresh_book_list()
             self.refresh_user_list()
@@ -1113,6 +3316,7 @@ class LibraryApp(tk.Tk):
             self.borrow_user_entry.delete(0, tk.END)
             self.borrow_isbn_entry.delete(0, tk.END)
             self.days_entry.delete(0, tk.END)
+            self.barcode_entry.delete(0, tk.END)
             self.update_status(message)
         else:
             messagebox.showerror("Error", message)
@@ -1136,6 +3340,22 @@ class LibraryApp(tk.Tk):
         else:
             messagebox.showerror("Error", message)
     
+    def place_hold(self):
+        user_id = self.borrow_user_entry.get().strip()
+        isbn = self.borrow_isbn_entry.get().strip()
+        
+        if not all([user_id, isbn]):
+            messagebox.showerror("Error", "User ID and ISBN are required!")
+            return
+        
+        success, message = self.lms.place_hold(user_id, isbn, self.hold_priority.get())
+        if success:
+            self.borrow_user_entry.delete(0, tk.END)
+            self.borrow_isbn_entry.delete(0, tk.END)
+            self.update_status(message)
+        else:
+            messagebox.showerror("Error", message)
+    
     def update_borrowed_books(self, user_id=None):
         self.borrowed_text.delete(1.0, tk.END)
         
@@ -1262,7 +3482,45 @@ class LibraryApp(tk.Tk):
                 f"   ISBN: {book.isbn}\n"
                 f"   Borrowed {count} time(s)\n"
                 f"   Available: {book.available}/{book.quantity}\n\n")
+    
+    def show_hold_queues(self):
+        hold_queues = self.lms.get_hold_queue_lengths()
+        self.report_text.delete(1.0, tk.END)
+        
+        if not hold_queues:
+            self.report_text.insert(tk.END, "No books have holds waiting.")
+            return
+        
+        self.report_text.insert(tk.END, "=== Hold Queues ===\n\n")
+        
+        for book, length in hold_queues:
+            self.report_text.insert(tk.END, 
+                f"{book.title} (ISBN: {book.isbn})\n"
+                f"   Waiting: {length} user(s)\n\n")
+    
+    def show_fines(self):
+        total = self.lms.get_total_outstanding_fines()
+        users = self.lms.get_users_over_fine_threshold()
+        self.report_text.delete(1.0, tk.END)
+        
+        self.report_text.insert(tk.END, "=== Outstanding Fines ===\n\n")
+        self.report_text.insert(tk.END, f"Total outstanding: ${total / 100:.2f}\n\n")
+        
+        if not users:
+            self.report_text.insert(tk.END, f"No users owe more than ${FINE_THRESHOLD / 100:.2f}.")
+            return
+        
+        self.report_text.insert(tk.END, f"Users owing more than ${FINE_THRESHOLD / 100:.2f}:\n\n")
+        for user, balance in users:
+            self.report_text.insert(tk.END, 
+                f"{user.name} (ID: {user.user_id})\n"
+                f"   Balance: ${balance / 100:.2f}\n\n")
 
 if __name__ == "__main__":
-    app = LibraryApp()
-    app.mainloop()
\ No newline at end of file
+    if "--benchmark-reports" in sys.argv:
+        benchmark_parallel_reports()
+    elif "--benchmark" in sys.argv:
+        benchmark_main(sys.argv[1:])
+    else:
+        app = LibraryApp()
+        app.mainloop()
\ No newline at end of file
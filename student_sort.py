@@ -0,0 +1,890 @@
+import argparse
+import bisect
+import csv
+import heapq
+import json
+import os
+import random
+import re
+import string
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Runs shorter than this are finished with insertion sort
+INSERTION_CUTOFF = 16
+
+# Quadratic sorts from Assignment.ipynb, kept as benchmark baselines
+def Bubble_Sort_By_ID(students):
+    n = len(students)
+    flag=0
+    for i in range(n-1):
+        for j in range(0, n-i-1):
+            if students[j]["ID"] > students[j + 1]["ID"]:
+                students[j],students[j + 1] = students[j + 1],students[j]
+                flag=1
+        if not flag:
+            break
+
+def Insertion_Sort_By_Name(students):
+    n = len(students)
+    for i in range(1 , n):
+        key_student = students[i]
+        j=i-1
+        while j>=0 and students[j]["Name"] > key_student["Name"]:
+            students[j + 1]= students[j]
+            j-=1
+            students[j+1]=key_student
+
+def Selection_Sort_By_cgpa_Descending(students):
+    n = len(students)
+    for i in range(n):
+        max_index = i
+        for j in range(i + 1, n):
+            if students[j]["cgpa"] > students[max_index]["cgpa"]:
+                max_index = j
+        students[i] , students[max_index] = students[max_index] , students[i]
+
+# Insertion Sort of a[lo:hi] in place (stable)
+def insertion_sort(a, lo=0, hi=None):
+    if hi is None:
+        hi = len(a)
+    for i in range(lo + 1, hi):
+        item = a[i]
+        j = i - 1
+        while j >= lo and item < a[j]:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = item
+
+# Merge the sorted runs a[lo:mid] and a[mid:hi] (stable, buffers only the left run)
+def _merge(a, lo, mid, hi):
+    if not a[mid] < a[mid - 1]:
+        return  # runs are already in order
+    left = a[lo:mid]
+    n_left = len(left)
+    i, j, k = 0, mid, lo
+    while i < n_left and j < hi:
+        if a[j] < left[i]:
+            a[k] = a[j]
+            j += 1
+        else:
+            a[k] = left[i]
+            i += 1
+        k += 1
+    # Whatever is left of the right run is already in place
+    a[k:k + n_left - i] = left[i:]
+
+# Merge Sort: bottom-up, starting from insertion-sorted blocks (stable)
+def merge_sort(a):
+    n = len(a)
+    for lo in range(0, n, INSERTION_CUTOFF):
+        insertion_sort(a, lo, min(lo + INSERTION_CUTOFF, n))
+    width = INSERTION_CUTOFF
+    while width < n:
+        for lo in range(0, n - width, 2 * width):
+            _merge(a, lo, lo + width, min(lo + 2 * width, n))
+        width *= 2
+
+# Heap Sort of a[lo:hi] in place with a max-heap
+def _sift_down(a, lo, root, size):
+    item = a[lo + root]
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            break
+        if child + 1 < size and a[lo + child] < a[lo + child + 1]:
+            child += 1
+        if not item < a[lo + child]:
+            break
+        a[lo + root] = a[lo + child]
+        root = child
+    a[lo + root] = item
+
+def heap_sort(a, lo=0, hi=None):
+    if hi is None:
+        hi = len(a)
+    size = hi - lo
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(a, lo, root, size)
+    for end in range(size - 1, 0, -1):
+        a[lo], a[lo + end] = a[lo + end], a[lo]
+        _sift_down(a, lo, 0, end)
+
+# Introsort: quicksort that switches to heap sort when recursion gets too deep
+def intro_sort(a):
+    _intro_sort(a, 0, len(a), 2 * len(a).bit_length())
+
+def _intro_sort(a, lo, hi, depth):
+    while hi - lo > INSERTION_CUTOFF:
+        if depth == 0:
+            heap_sort(a, lo, hi)
+            return
+        depth -= 1
+        split = _partition(a, lo, hi)
+        # Recurse into the smaller side and loop on the larger one, so the stack stays O(log n)
+        if split - lo < hi - split:
+            _intro_sort(a, lo, split, depth)
+            lo = split
+        else:
+            _intro_sort(a, split, hi, depth)
+            hi = split
+    insertion_sort(a, lo, hi)
+
+def _partition(a, lo, hi):
+    # Hoare partition around the median of the first, middle and last items;
+    # returns split with a[lo:split] <= pivot <= a[split:hi], both sides non-empty
+    x, y, z = a[lo], a[(lo + hi) // 2], a[hi - 1]
+    if y < x:
+        x, y = y, x
+    if z < y:
+        y = x if z < x else z
+    pivot = y
+    i = lo - 1
+    j = hi
+    while True:
+        i += 1
+        while a[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < a[j]:
+            j -= 1
+        if i >= j:
+            return j + 1
+        a[i], a[j] = a[j], a[i]
+
+# Timsort: merge natural runs, extending short ones with insertion sort (stable)
+def _min_run(n):
+    extra = 0
+    while n >= 64:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+def _count_run(a, lo, hi):
+    # Length of the run starting at lo; strictly descending runs are reversed in place
+    i = lo + 1
+    if i == hi:
+        return 1
+    if a[i] < a[i - 1]:
+        while i + 1 < hi and a[i + 1] < a[i]:
+            i += 1
+        a[lo:i + 1] = a[lo:i + 1][::-1]
+    else:
+        while i + 1 < hi and not a[i + 1] < a[i]:
+            i += 1
+    return i + 1 - lo
+
+def _merge_at(a, runs, i):
+    lo, left_length = runs[i]
+    right_length = runs[i + 1][1]
+    _merge(a, lo, lo + left_length, lo + left_length + right_length)
+    runs[i] = (lo, left_length + right_length)
+    del runs[i + 1]
+
+def _merge_collapse(a, runs):
+    # Keep run lengths on the stack shrinking faster than Fibonacci so merges stay balanced
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        _merge_at(a, runs, n)
+
+def tim_sort(a):
+    n = len(a)
+    min_run = _min_run(n)
+    runs = []  # stack of (start, length) of runs waiting to be merged
+    lo = 0
+    while lo < n:
+        length = _count_run(a, lo, n)
+        if length < min_run:
+            length = min(min_run, n - lo)
+            insertion_sort(a, lo, lo + length)
+        runs.append((lo, length))
+        _merge_collapse(a, runs)
+        lo += length
+    while len(runs) > 1:
+        _merge_at(a, runs, len(runs) - 2)
+
+# LSD Radix Sort of non-negative ints, 8 or 16 bits per pass (stable, no comparisons)
+def radix_argsort(keys):
+    order = list(range(len(keys)))
+    if not keys:
+        return order
+    if min(keys) < 0:
+        raise ValueError("Radix sort needs non-negative integers.")
+    top = max(keys)
+    bits = 16 if len(keys) >= 1 << 16 else 8
+    mask = (1 << bits) - 1
+    shift = 0
+    while top >> shift:
+        buckets = [[] for _ in range(mask + 1)]
+        for i in order:
+            buckets[(keys[i] >> shift) & mask].append(i)
+        order = [i for bucket in buckets for i in bucket]
+        shift += bits
+    return order
+
+def radix_sort(a):
+    a[:] = [a[i] for i in radix_argsort(a)]
+
+ALGORITHMS = {
+    'tim': tim_sort,
+    'intro': intro_sort,
+    'merge': merge_sort,
+    'heap': heap_sort,
+    'insertion': insertion_sort,
+    'builtin': list.sort,
+}
+
+# Algorithms that can sort lists of non-negative ints
+INTEGER_ALGORITHMS = dict(ALGORITHMS, radix=radix_sort)
+
+# Positions that put integer keys in order, ties kept in original order
+def _argsort_ints(keys, algorithm):
+    if algorithm not in INTEGER_ALGORITHMS:
+        raise ValueError(f"Unknown sort algorithm: {algorithm}")
+    if algorithm == 'radix':
+        return radix_argsort(keys)  # already stable, no need to pack positions
+    # The position is the last digit, so keys are unique (hence stable) and sort as plain ints
+    n = len(keys)
+    packed = [key * n + i for i, key in enumerate(keys)]
+    INTEGER_ALGORITHMS[algorithm](packed)
+    return [value % n for value in packed]
+
+# Sort records by key and return a new list
+def sort(records, key=None, reverse=False, algorithm='tim'):
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown sort algorithm: {algorithm}")
+    records = list(records)
+    if key is None:
+        key = lambda record: record
+    # Each key is computed once, and the position breaks ties, so every algorithm is stable
+    # and never compares two records directly. Reversed sorts negate the position so that
+    # equal keys keep their original order once the result is reversed.
+    sign = -1 if reverse else 1
+    items = [(key(record), sign * i) for i, record in enumerate(records)]
+    ALGORITHMS[algorithm](items)
+    if reverse:
+        items.reverse()
+    return [records[sign * i] for _, i in items]
+
+# Multi-key sort
+def _parse_key_spec(spec):
+    # "Name" sorts ascending, "-cgpa" descending; (field or function, descending) also works
+    if isinstance(spec, tuple):
+        field, descending = spec
+    elif spec.startswith('-'):
+        field, descending = spec[1:], True
+    else:
+        field, descending = spec, False
+    if callable(field):
+        return field, descending
+    return (lambda record: record[field]), descending
+
+def _rank_column(column, descending):
+    # Dense ranks, so every key type (and every direction) becomes a small integer
+    values = sorted(set(column))
+    if descending:
+        values.reverse()
+    rank = {value: i for i, value in enumerate(values)}
+    return [rank[value] for value in column], len(values)
+
+# Positions of records in sorted order for keys like ["dept", "-cgpa", "Name"]
+def argsort_by_keys(records, keys, algorithm='tim'):
+    records = list(records)
+    combined = [0] * len(records)
+    for spec in keys:
+        get, descending = _parse_key_spec(spec)
+        # One lookup per record per key; the sort itself only compares integers
+        codes, radix = _rank_column([get(record) for record in records], descending)
+        combined = [value * radix + code for value, code in zip(combined, codes)]
+    return _argsort_ints(combined, algorithm)
+
+def sort_by_keys(records, keys, algorithm='tim'):
+    records = list(records)
+    return [records[i] for i in argsort_by_keys(records, keys, algorithm)]
+
+# Natural ordering of student IDs: "DBU99" < "DBU100" (plain string comparison puts "DBU100" first)
+STUDENT_ID_PATTERN = re.compile(r'(\D*)(\d+)')
+
+def split_student_id(student_id):
+    # (prefix, number); IDs that do not end in digits sort by prefix only
+    match = STUDENT_ID_PATTERN.fullmatch(student_id)
+    if not match:
+        return student_id, 0
+    return match.group(1), int(match.group(2))
+
+# Parse every ID once into one int: prefix rank in the high bits, number in the low bits
+def student_id_keys(ids):
+    parsed = [split_student_id(student_id) for student_id in ids]
+    if not parsed:
+        return []
+    rank = {prefix: i for i, prefix in enumerate(sorted({prefix for prefix, _ in parsed}))}
+    number_bits = max(number for _, number in parsed).bit_length()
+    return [(rank[prefix] << number_bits) | number for prefix, number in parsed]
+
+def sort_by_id(records, field="ID", reverse=False, algorithm='radix'):
+    records = list(records)
+    keys = student_id_keys([record[field] for record in records])
+    if reverse and keys:
+        top = max(keys)
+        keys = [top - key for key in keys]
+    return [records[i] for i in _argsort_ints(keys, algorithm)]
+
+# Top-k Selection: the k best records, best first, without sorting everything
+# Heap: keep the k best seen so far in a min-heap whose root is the worst of them, O(n log k)
+def _top_k_heap(keys, k, largest):
+    wrap = (lambda key: key) if largest else _Descending
+    heap = []
+    for i, key in enumerate(keys):
+        item = (wrap(key), -i)  # on equal keys the earlier record ranks higher
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif heap[0] < item:
+            heapq.heapreplace(heap, item)
+    return [-i for _, i in heap]
+
+# Quickselect: keep only the side of a random pivot that still holds the k-th best, expected O(n)
+def _top_k_quickselect(keys, k, largest):
+    rng = random.Random(k)
+    candidates = list(range(len(keys)))
+    selected = []
+    while k > 0 and candidates:
+        pivot = keys[rng.choice(candidates)]
+        if largest:
+            better = [i for i in candidates if pivot < keys[i]]
+        else:
+            better = [i for i in candidates if keys[i] < pivot]
+        if len(better) >= k:
+            candidates = better
+            continue
+        # Positions stay in input order, so equal keys are cut in favour of earlier records
+        equal = [i for i in candidates if keys[i] == pivot]
+        selected += better + equal[:k - len(better)]
+        k -= len(better) + len(equal)
+        if largest:
+            candidates = [i for i in candidates if keys[i] < pivot]
+        else:
+            candidates = [i for i in candidates if pivot < keys[i]]
+    return selected
+
+TOP_K_METHODS = {
+    'heap': _top_k_heap,
+    'quickselect': _top_k_quickselect,
+}
+
+def top_k(records, k, key=None, largest=True, method='heap'):
+    if method not in TOP_K_METHODS:
+        raise ValueError(f"Unknown top-k method: {method}")
+    records = list(records)
+    if key is None:
+        key = lambda record: record
+    keys = [key(record) for record in records]
+    if k <= 0:
+        return []
+    positions = TOP_K_METHODS[method](keys, k, largest)
+    # Only the k winners are sorted
+    positions = sort(positions, key=lambda i: (keys[i], -i if largest else i), reverse=largest)
+    return [records[i] for i in positions]
+
+# Parallel Sample Sort: split keys into value ranges at sampled splitters, sort each range in a worker
+def _sort_bucket(items, algorithm):
+    # Runs in a worker process; items are (key, position) pairs
+    ALGORITHMS[algorithm](items)
+    return [i for _, i in items]
+
+def parallel_sort(records, key=None, reverse=False, workers=None, oversample=32, algorithm='builtin', seed=0):
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown sort algorithm: {algorithm}")
+    records = list(records)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(records) < workers * oversample:
+        return sort(records, key, reverse, algorithm)
+    if key is None:
+        key = lambda record: record
+    # Same tie-break as sort(): negated positions keep equal keys in input order once reversed
+    sign = -1 if reverse else 1
+    items = [(key(record), sign * i) for i, record in enumerate(records)]
+    sample = sorted(random.Random(seed).sample(items, workers * oversample))
+    splitters = [sample[j * oversample] for j in range(1, workers)]
+    buckets = [[] for _ in range(workers)]
+    for item in items:
+        buckets[bisect.bisect_right(splitters, item)].append(item)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        order = [i for bucket in pool.map(_sort_bucket, buckets, [algorithm] * workers) for i in bucket]
+    if reverse:
+        order.reverse()
+    return [records[sign * i] for i in order]
+
+# External Merge Sort for record files larger than memory
+# Wrapper that reverses the order of any comparable value (strings, tuples, numbers)
+class _Descending:
+    __slots__ = ('value',)
+    
+    def __init__(self, value):
+        self.value = value
+    
+    def __lt__(self, other):
+        return other.value < self.value
+    
+    def __eq__(self, other):
+        return self.value == other.value
+
+# Picklable key function for keys like ["dept", "-cgpa", "Name"], so worker processes can use it
+class RecordKey:
+    def __init__(self, keys, types=None):
+        # types: field -> conversion applied to the key value, e.g. {'cgpa': float} for CSV input
+        types = types or {}
+        self.fields = []
+        for spec in keys:
+            if isinstance(spec, tuple):
+                field, descending = spec
+            elif spec.startswith('-'):
+                field, descending = spec[1:], True
+            else:
+                field, descending = spec, False
+            self.fields.append((field, descending, types.get(field)))
+    
+    def __call__(self, record):
+        key = []
+        for field, descending, convert in self.fields:
+            value = record[field]
+            if convert:
+                value = convert(value)
+            key.append(_Descending(value) if descending else value)
+        return tuple(key)
+
+def _file_format(path, file_format=None):
+    file_format = file_format or os.path.splitext(path)[1].lstrip('.').lower()
+    if file_format not in ('csv', 'jsonl'):
+        raise ValueError(f"Unsupported record format: {file_format}")
+    return file_format
+
+def read_records(path, file_format=None):
+    if _file_format(path, file_format) == 'csv':
+        with open(path, newline='') as f:
+            yield from csv.DictReader(f)
+    else:
+        yield from _read_run(path)
+
+def write_records(records, path, file_format=None):
+    count = 0
+    if _file_format(path, file_format) == 'csv':
+        with open(path, 'w', newline='') as f:
+            writer = None
+            for record in records:
+                if writer is None:
+                    writer = csv.DictWriter(f, fieldnames=list(record))
+                    writer.writeheader()
+                writer.writerow(record)
+                count += 1
+    else:
+        count = _write_run(records, path)
+    return count
+
+# Sorted runs are spilled as JSONL whatever the input format
+def _read_run(path):
+    with open(path) as f:
+        for line in f:
+            yield json.loads(line)
+
+def _write_run(records, path):
+    count = 0
+    with open(path, 'w') as f:
+        for record in records:
+            f.write(json.dumps(record))
+            f.write('\n')
+            count += 1
+    return count
+
+def _sort_run(records, path, record_key, algorithm):
+    # Runs in a worker process
+    _write_run(sort(records, key=record_key, algorithm=algorithm), path)
+    return path
+
+def _chunks(records, chunk_size):
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _spill_runs(records, run_dir, record_key, chunk_size, workers, algorithm):
+    chunks = enumerate(_chunks(records, chunk_size))
+    run_path = lambda i: os.path.join(run_dir, f"run{i}.jsonl")
+    if workers == 1:
+        return [_sort_run(chunk, run_path(i), record_key, algorithm) for i, chunk in chunks]
+    runs = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for i, chunk in chunks:
+            pending.append(pool.submit(_sort_run, chunk, run_path(i), record_key, algorithm))
+            # At most two chunks per worker in flight, so memory stays bounded by the chunk size
+            if len(pending) >= 2 * workers:
+                runs.append(pending.popleft().result())
+        runs.extend(future.result() for future in pending)
+    return runs
+
+def _merge_runs(paths, record_key):
+    # heapq.merge keeps one record per run on its heap and prefers earlier runs on ties (stable)
+    return heapq.merge(*(_read_run(path) for path in paths), key=record_key)
+
+# Stream the records of path in sorted order using bounded memory
+def iter_external_sort(path, keys, types=None, file_format=None, chunk_size=100_000,
+                       workers=None, fan_in=64, algorithm='builtin', tmp_dir=None):
+    record_key = RecordKey(keys, types)
+    workers = workers or os.cpu_count() or 1
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir:
+        runs = _spill_runs(read_records(path, file_format), run_dir, record_key, chunk_size, workers, algorithm)
+        # Merge in passes when there are more runs than files we want open at once
+        level = 0
+        while len(runs) > fan_in:
+            merged = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                merged_path = os.path.join(run_dir, f"merge{level}_{start}.jsonl")
+                _write_run(_merge_runs(group, record_key), merged_path)
+                for run in group:
+                    os.remove(run)
+                merged.append(merged_path)
+            runs = merged
+            level += 1
+        yield from _merge_runs(runs, record_key)
+
+def external_sort(input_path, output_path, keys, types=None, input_format=None, output_format=None, **options):
+    # Returns the number of records written
+    records = iter_external_sort(input_path, keys, types, input_format, **options)
+    return write_records(records, output_path, output_format)
+
+# Sort Instrumentation (opt-in): counts comparisons, moves and buffer copies of any in-place sort
+class SortStats:
+    def __init__(self):
+        self.comparisons = 0
+        self.moves = 0  # list slots written; a swap is two moves
+        self.buffers = 0  # slice copies taken from the list (merge buffers, run reversals)
+        self.buffered_items = 0  # items copied into those buffers
+        self.peak_bytes = 0  # peak memory traced by tracemalloc during the sort
+        self.seconds = 0.0  # wall time, including the counting overhead
+    
+    def to_dict(self):
+        return dict(self.__dict__)
+
+# Element wrapper that counts every comparison made on it
+class _Counted:
+    __slots__ = ('value', 'stats')
+    
+    def __init__(self, value, stats):
+        self.value = value
+        self.stats = stats
+    
+    def _compare(self, other):
+        self.stats.comparisons += 1
+        return other.value if isinstance(other, _Counted) else other
+    
+    def __lt__(self, other):
+        return self.value < self._compare(other)
+    
+    def __le__(self, other):
+        return self.value <= self._compare(other)
+    
+    def __gt__(self, other):
+        return self.value > self._compare(other)
+    
+    def __ge__(self, other):
+        return self.value >= self._compare(other)
+    
+    def __eq__(self, other):
+        return self.value == self._compare(other)
+    
+    def __hash__(self):
+        return hash(self.value)
+
+# Student record wrapper whose field values count their comparisons
+class _CountedRecord:
+    __slots__ = ('record', 'stats')
+    
+    def __init__(self, record, stats):
+        self.record = record
+        self.stats = stats
+    
+    def __getitem__(self, field):
+        return _Counted(self.record[field], self.stats)
+
+class _CountingList(list):
+    def __init__(self, items, stats):
+        super().__init__(items)
+        self.stats = stats
+    
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.stats.moves += len(value)
+        else:
+            self.stats.moves += 1
+        super().__setitem__(index, value)
+    
+    def __getitem__(self, index):
+        item = super().__getitem__(index)
+        if isinstance(index, slice):
+            self.stats.buffers += 1
+            self.stats.buffered_items += len(item)
+        return item
+
+def _unwrap(item):
+    if isinstance(item, _Counted):
+        return item.value
+    if isinstance(item, _CountedRecord):
+        return item.record
+    return item
+
+# Wrap an in-place sort such as Bubble_Sort_By_ID or tim_sort; the wrapper sorts
+# the list it is given and returns a SortStats. list.sort writes slots directly, so its moves read 0.
+def instrument(sort_function):
+    def instrumented(a, *args, **kwargs):
+        stats = SortStats()
+        wrap = _CountedRecord if a and isinstance(a[0], dict) else _Counted
+        data = _CountingList((wrap(item, stats) for item in a), stats)
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        sort_function(data, *args, **kwargs)
+        stats.seconds = time.perf_counter() - start
+        stats.peak_bytes = tracemalloc.get_traced_memory()[1] - baseline
+        if not tracing:
+            tracemalloc.stop()
+        a[:] = [_unwrap(item) for item in data]
+        return stats
+    instrumented.__name__ = sort_function.__name__
+    return instrumented
+
+# Benchmark
+DEPARTMENTS = ['CS', 'DS', 'IT', 'SE', 'IS']
+
+def iter_students(n, seed=42):
+    rng = random.Random(seed)
+    ids = rng.sample(range(10 ** 7), n) if n <= 10 ** 7 else range(n)
+    for number in ids:
+        yield {
+            "ID": f"DBU{number}",
+            "Name": ''.join(rng.choice(string.ascii_lowercase) for _ in range(6)).capitalize(),
+            "dept": rng.choice(DEPARTMENTS),
+            "cgpa": round(rng.uniform(2.0, 4.0), 2),
+        }
+
+def generate_students(n, seed=42):
+    return list(iter_students(n, seed))
+
+# The three Assignment.ipynb tasks: (label, baseline, key, reverse)
+BENCHMARK_TASKS = [
+    ('ID', Bubble_Sort_By_ID, lambda s: s["ID"], False),
+    ('Name', Insertion_Sort_By_Name, lambda s: s["Name"], False),
+    ('cgpa desc', Selection_Sort_By_cgpa_Descending, lambda s: s["cgpa"], True),
+]
+
+def _time(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+def benchmark_sorts(sizes, algorithms, quadratic_limit=2000, seed=42):
+    # Quadratic baselines are timed at quadratic_limit records and scaled by (n / limit) ** 2
+    results = []
+    for n in sizes:
+        students = generate_students(n, seed)
+        for label, baseline, key, reverse in BENCHMARK_TASKS:
+            m = min(n, quadratic_limit)
+            seconds = _time(baseline, students[:m]) * (n / m) ** 2
+            results.append((n, label, baseline.__name__, seconds, m < n))
+            for algorithm in algorithms:
+                seconds = _time(sort, students, key=key, reverse=reverse, algorithm=algorithm)
+                results.append((n, label, algorithm, seconds, False))
+    return results
+
+# Rank-encoded multi-key sort against a tuple key built per record
+MULTI_KEY = ["dept", "-cgpa", "Name"]
+
+def benchmark_multi_key(sizes, algorithms, seed=42):
+    results = []
+    tuple_key = lambda s: (s["dept"], -s["cgpa"], s["Name"])
+    for n in sizes:
+        students = generate_students(n, seed)
+        for algorithm in algorithms:
+            seconds = _time(sort, students, key=tuple_key, algorithm=algorithm)
+            results.append((n, 'tuple key', algorithm, seconds, False))
+            seconds = _time(sort_by_keys, students, MULTI_KEY, algorithm=algorithm)
+            results.append((n, 'ranked', algorithm, seconds, False))
+    return results
+
+# Natural ID sorts against sorting on the ID string
+def benchmark_ids(sizes, algorithms, quadratic_limit=2000, seed=42):
+    results = []
+    for n in sizes:
+        students = generate_students(n, seed)
+        m = min(n, quadratic_limit)
+        seconds = _time(Bubble_Sort_By_ID, students[:m]) * (n / m) ** 2
+        results.append((n, 'ID', 'Bubble_Sort_By_ID', seconds, m < n))
+        for algorithm in algorithms:
+            seconds = _time(sort, students, key=lambda s: s["ID"], algorithm=algorithm)
+            results.append((n, 'ID string', algorithm, seconds, False))
+        for algorithm in ['radix'] + algorithms:
+            seconds = _time(sort_by_id, students, algorithm=algorithm)
+            results.append((n, 'ID natural', algorithm, seconds, False))
+    return results
+
+# External sort of a generated JSONL roster, one worker against a process pool
+def benchmark_external(sizes, workers, chunk_size, seed=42):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n in sizes:
+            input_path = os.path.join(tmp_dir, "students.jsonl")
+            output_path = os.path.join(tmp_dir, "sorted.jsonl")
+            write_records(iter_students(n, seed), input_path)
+            for worker_count in sorted({1, workers}):
+                seconds = _time(external_sort, input_path, output_path, MULTI_KEY,
+                                chunk_size=chunk_size, workers=worker_count, tmp_dir=tmp_dir)
+                results.append((n, 'external', f"{worker_count} worker(s), {chunk_size} per run", seconds, False))
+    return results
+
+# cgpa rankings: selection sort baseline, full sorts and top-k selection
+def benchmark_ranking(sizes, k, workers, quadratic_limit=2000, seed=42):
+    results = []
+    cgpa = lambda s: s["cgpa"]
+    for n in sizes:
+        students = generate_students(n, seed)
+        m = min(n, quadratic_limit)
+        seconds = _time(Selection_Sort_By_cgpa_Descending, students[:m]) * (n / m) ** 2
+        results.append((n, 'ranking', 'Selection_Sort_By_cgpa_Descending', seconds, m < n))
+        for algorithm in ('tim', 'builtin'):
+            seconds = _time(sort, students, key=cgpa, reverse=True, algorithm=algorithm)
+            results.append((n, 'ranking', f"sort ({algorithm})", seconds, False))
+        seconds = _time(parallel_sort, students, key=cgpa, reverse=True, workers=workers)
+        results.append((n, 'ranking', f"parallel_sort ({workers} workers)", seconds, False))
+        for method in TOP_K_METHODS:
+            seconds = _time(top_k, students, k, key=cgpa, method=method)
+            results.append((n, f"top {k}", method, seconds, False))
+        seconds = _time(heapq.nlargest, k, students, key=cgpa)
+        results.append((n, f"top {k}", 'heapq.nlargest', seconds, False))
+    return results
+
+# Instrumented runs over presorted, reversed, random and few-unique inputs
+INSTRUMENT_TASKS = [
+    ('ID', Bubble_Sort_By_ID, "ID", False),
+    ('Name', Insertion_Sort_By_Name, "Name", False),
+    ('cgpa desc', Selection_Sort_By_cgpa_Descending, "cgpa", True),
+]
+
+INPUT_KINDS = ['presorted', 'reversed', 'random', 'few-unique']
+
+def _arrange(students, field, reverse, kind, rng):
+    students = [dict(student) for student in students]
+    if kind == 'few-unique':
+        values = rng.sample([student[field] for student in students], min(4, len(students)))
+        for student in students:
+            student[field] = rng.choice(values)
+    if kind == 'presorted':
+        students.sort(key=lambda s: s[field], reverse=reverse)
+    elif kind == 'reversed':
+        students.sort(key=lambda s: s[field], reverse=not reverse)
+    else:
+        rng.shuffle(students)
+    return students
+
+def benchmark_instrumented(sizes, algorithms, quadratic_limit=2000, seed=42):
+    # Rows of (n, task, input kind, algorithm, plain seconds, SortStats); engine algorithms sort the
+    # same (key, position) items that sort() builds, and baselines only run up to quadratic_limit
+    results = []
+    rng = random.Random(seed)
+    for n in sizes:
+        students = generate_students(n, seed)
+        for label, baseline, field, reverse in INSTRUMENT_TASKS:
+            for kind in INPUT_KINDS:
+                records = _arrange(students, field, reverse, kind, rng)
+                runs = []
+                if n <= quadratic_limit:
+                    runs.append((baseline.__name__, baseline, lambda: [dict(r) for r in records]))
+                if reverse:
+                    # The only descending task is on cgpa, so the numeric key can simply be negated
+                    make_items = lambda: [(-r[field], i) for i, r in enumerate(records)]
+                else:
+                    make_items = lambda: [(r[field], i) for i, r in enumerate(records)]
+                for algorithm in algorithms:
+                    runs.append((algorithm, ALGORITHMS[algorithm], make_items))
+                for name, function, make_input in runs:
+                    seconds = _time(function, make_input())
+                    stats = instrument(function)(make_input())
+                    results.append((n, label, kind, name, seconds, stats))
+    return results
+
+def print_instrumented(results):
+    print(f"{'records':>8}  {'task':<10} {'input':<11} {'algorithm':<34} {'seconds':>9} "
+          f"{'compares':>11} {'moves':>11} {'buffered':>10} {'peak KB':>9}")
+    best = {}
+    for n, label, kind, name, seconds, stats in results:
+        print(f"{n:>8}  {label:<10} {kind:<11} {name:<34} {seconds:>9.4f} "
+              f"{stats.comparisons:>11} {stats.moves:>11} {stats.buffered_items:>10} {stats.peak_bytes / 1024:>9.1f}")
+        group = (n, label, kind)
+        if group not in best or seconds < best[group][1]:
+            best[group] = (name, seconds)
+    print()
+    for (n, label, kind), (name, seconds) in best.items():
+        print(f"fastest for {label} on {kind} input ({n} records): {name}")
+
+def print_benchmark(results):
+    print(f"{'records':>10}  {'task':<10} {'algorithm':<36} {'seconds':>12}")
+    for n, label, name, seconds, estimated in results:
+        note = " (est.)" if estimated else ""
+        print(f"{n:>10}  {label:<10} {name:<36} {seconds:>12.3f}{note}")
+
+def benchmark_main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the student record sorts")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help="record counts to sort (10000000 needs several GB of memory)")
+    parser.add_argument('--algorithms', nargs='+', default=['tim', 'intro', 'merge', 'heap', 'builtin'],
+                        choices=sorted(set(ALGORITHMS) - {'insertion'}))
+    parser.add_argument('--quadratic-limit', type=int, default=2000,
+                        help="largest input the O(n^2) baselines are actually run on")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--multi-key', action='store_true',
+                        help="benchmark sorting by (dept, -cgpa, Name) instead")
+    parser.add_argument('--ids', action='store_true',
+                        help="benchmark natural student ID sorts instead")
+    parser.add_argument('--external', action='store_true',
+                        help="benchmark the external merge sort on a generated JSONL file instead")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--chunk-size', type=int, default=100_000,
+                        help="records per spilled run in the external sort")
+    parser.add_argument('--ranking', action='store_true',
+                        help="benchmark cgpa rankings and top-k selection instead")
+    parser.add_argument('--top', type=int, default=100, help="k for the top-k benchmark")
+    parser.add_argument('--instrument', action='store_true',
+                        help="count comparisons, moves and memory on presorted, reversed, random "
+                             "and few-unique inputs instead (try --sizes 2000)")
+    args = parser.parse_args(argv)
+    if args.instrument:
+        print_instrumented(benchmark_instrumented(args.sizes, args.algorithms, args.quadratic_limit, args.seed))
+    elif args.multi_key:
+        print_benchmark(benchmark_multi_key(args.sizes, args.algorithms, args.seed))
+    elif args.external:
+        print_benchmark(benchmark_external(args.sizes, args.workers, args.chunk_size, args.seed))
+    elif args.ranking:
+        print_benchmark(benchmark_ranking(args.sizes, args.top, args.workers, args.quadratic_limit, args.seed))
+    elif args.ids:
+        print_benchmark(benchmark_ids(args.sizes, args.algorithms, args.quadratic_limit, args.seed))
+    else:
+        print_benchmark(benchmark_sorts(args.sizes, args.algorithms, args.quadratic_limit, args.seed))
+
+if __name__ == "__main__":
+    benchmark_main()
@@ -1,4 +1,12 @@
 #2,,wrtite pythone function to implement  linear and binary search algorithm based on above pseudocode 
+import bisect
+import sys
+import time
+try:
+    import numpy as np
+except ImportError:
+    np=None#batch searches fall back to pure python
+
 #linear search implementation 
 def linear_search (arr,target):
     for i in range(len(arr)):
@@ -14,25 +22,390 @@ def test_search(arr,target):
    high=len(arr)-1
    while low<=high:
         mid=(low+high)//2
-        if arr (mid==target):
+        if arr[mid]==target:
             return mid#element found,return the index 
         elif arr[mid]>target:
             high=mid-1#search in the left half 
         else:
             low=mid+1#search in the right half
-     return-1#element not found 
- 
-#3,test apython function using real world example dataset
-arr=[1,3,5,7,9] # unsorted dataset
-target=5#we want to search for the value 50
+   return -1#element not found 
+
+#bound searches on a sorted array, O(log n) each
+#first index whose value is >= target (len(arr) if there is none)
+def lower_bound(arr,target,low=0,high=None):
+    return bisect.bisect_left(arr,target,low,len(arr) if high is None else high)
+
+#first index whose value is > target
+def upper_bound(arr,target,low=0,high=None):
+    return bisect.bisect_right(arr,target,low,len(arr) if high is None else high)
+
+#(first, last+1) of the run equal to target; both are the insertion point when target is missing
+def equal_range(arr,target):
+    first=lower_bound(arr,target)
+    return first,upper_bound(arr,target,first)
+
+#number of values with low<=value<=high
+def count_in_range(arr,low,high):
+    if high<low:
+        return 0
+    first=lower_bound(arr,low)
+    return upper_bound(arr,high,first)-first
+
+#batched bounds: one vectorized pass with numpy, otherwise one bisect per target
+#every batch bound returns plain lists, with or without numpy
+def batch_lower_bound(arr,targets):
+    if np is not None:
+        return np.searchsorted(np.asarray(arr),np.asarray(targets),side="left").tolist()
+    return [bisect.bisect_left(arr,target) for target in targets]
 
-#linear search test
-linear_result=linear search(arr,target)
-print(f"linear search result for{target}:inex{linear result}")
+def batch_upper_bound(arr,targets):
+    if np is not None:
+        return np.searchsorted(np.asarray(arr),np.asarray(targets),side="right").tolist()
+    return [bisect.bisect_right(arr,target) for target in targets]
 
+#returns (firsts, ends) as two lists
+def batch_equal_range(arr,targets):
+    return batch_lower_bound(arr,targets),batch_upper_bound(arr,targets)
 
+#counts for many (low, high) ranges given as two parallel sequences
+def batch_count_in_range(arr,lows,highs):
+    if np is not None:
+        a=np.asarray(arr)
+        counts=np.searchsorted(a,np.asarray(highs),side="right")-np.searchsorted(a,np.asarray(lows),side="left")
+        return np.maximum(counts,0).tolist()
+    return [count_in_range(arr,low,high) for low,high in zip(lows,highs)]
 
-#binary search test 
-sorted arr=sorted arr = sorted(arr) binary search requires the array to be Sorted 
-binary result =binary search(sorted arr,target)
-print(f"binary search result for{target}:index {binary result}")
\ No newline at end of file
+#interpolation search: guess the position from the value, O(log log n) on near-uniform numeric keys
+#after log2(n) guesses it falls back to midpoints, so clustered keys cost O(log n) instead of O(n)
+def interpolation_search(arr,target):
+    low=0
+    high=len(arr)-1
+    guesses=len(arr).bit_length()
+    while low<=high and arr[low]<=target<=arr[high]:
+        if arr[high]==arr[low]:
+            return low if arr[low]==target else -1
+        if guesses:
+            guesses-=1
+            pos=low+int((target-arr[low])*(high-low)//(arr[high]-arr[low]))
+            pos=min(max(pos,low),high)#float keys give a float estimate that may round outside [low,high]
+        else:
+            pos=(low+high)//2
+        if arr[pos]==target:
+            return pos#element found,return the index
+        elif arr[pos]<target:
+            low=pos+1
+        else:
+            high=pos-1
+    return -1#element not found
+
+#exponential (galloping) search: double the step from start until it passes target, then binary search
+#never calls len(), so it also works on unbounded sequences that raise IndexError past the end
+def exponential_search(arr,target,start=0):
+    low=start
+    step=1
+    high=start
+    while True:
+        try:
+            value=arr[high]
+        except IndexError:
+            break
+        if value>=target:
+            break
+        low=high+1
+        high=start+step
+        step*=2
+    #first index in [low,high] whose value is >= target; high may lie past the end
+    while low<high:
+        mid=(low+high)//2
+        try:
+            below=arr[mid]<target
+        except IndexError:
+            below=False
+        if below:
+            low=mid+1
+        else:
+            high=mid
+    try:
+        return low if arr[low]==target else -1
+    except IndexError:
+        return -1
+
+#galloping over sorted targets: each search starts where the previous one ended
+def gallop_batch_search(arr,targets):
+    result=[]
+    start=0
+    for target in targets:
+        i=exponential_search(arr,target,start)
+        result.append(i)
+        if i!=-1:
+            start=i
+    return result
+
+#binary search over the eytzinger (bfs) layout: node k has children 2k and 2k+1,
+#so the first levels of the tree share cache lines and the loop has no equality branch
+class EytzingerIndex:
+    def __init__(self,sorted_arr):
+        n=len(sorted_arr)
+        self.layout=[None]*(n+1)#1-based, slot 0 unused
+        self.positions=[-1]*(n+1)#index of each slot in sorted_arr
+        i=0
+        k=1
+        stack=[]
+        while stack or k<=n:#in-order walk of the implicit tree
+            if k<=n:
+                stack.append(k)
+                k*=2
+            else:
+                k=stack.pop()
+                self.layout[k]=sorted_arr[i]
+                self.positions[k]=i
+                i+=1
+                k=2*k+1
+    
+    #index in sorted_arr of the first occurrence of target, or -1
+    def search(self,target):
+        layout=self.layout
+        n=len(layout)-1
+        k=1
+        while k<=n:
+            k=2*k+(layout[k]<target)
+        k>>=(~k&(k+1)).bit_length()#drop the trailing right turns to reach the lower bound
+        if k and layout[k]==target:
+            return self.positions[k]
+        return -1
+
+#batch search: answer many targets in one call, -1 for every target not found
+#hash path for unsorted data, same answer as linear_search (index of the first match)
+def batch_linear_search(arr,targets):
+    first={}
+    for i,value in enumerate(arr):
+        first.setdefault(value,i)
+    return [first.get(target,-1) for target in targets]
+
+#searchsorted path for sorted data, returns a list with the index of the first match (-1 if absent)
+def batch_binary_search(arr,targets):
+    if np is not None:
+        a=np.asarray(arr)
+        t=np.asarray(targets)
+        if len(a)==0:
+            return [-1]*len(t)
+        idx=np.searchsorted(a,t)#all targets in one vectorized pass
+        hit=a[np.minimum(idx,len(a)-1)]==t
+        return np.where(hit,idx,-1).tolist()#same list type as the pure python path
+    result=[]
+    n=len(arr)
+    for target in targets:
+        i=bisect.bisect_left(arr,target)
+        result.append(i if i<n and arr[i]==target else -1)
+    return result
+
+#merge-join path when the targets are sorted too: one O(n+m) walk over both arrays
+def merge_join_search(arr,targets):
+    result=[]
+    i=0
+    n=len(arr)
+    for target in targets:
+        while i<n and arr[i]<target:
+            i+=1
+        result.append(i if i<n and arr[i]==target else -1)
+    return result
+
+def is_sorted(arr):
+    return all(arr[i]<=arr[i+1] for i in range(len(arr)-1))
+
+#pick the cheapest path: merge-join pays off once m*log2(n) outgrows n+m
+#every path returns a plain list of indexes, -1 for targets that are not found
+def batch_search(arr,targets,sorted_data=False):
+    if not sorted_data:
+        return batch_linear_search(arr,targets)
+    n=len(arr)
+    m=len(targets)
+    if np is None and m*max(n,1).bit_length()>n+m and is_sorted(targets):
+        return merge_join_search(arr,targets)
+    return batch_binary_search(arr,targets)
+
+#searchable collection that starts with linear scans and builds an index once
+#the scans it has paid for add up to the cost of building that index
+class SearchableCollection:
+    def __init__(self,items=(),build_factor=2):
+        self.items=list(items)
+        self.build_factor=build_factor
+        self.queries=0
+        self.hash_index=None#value: ascending list of positions
+        self.sorted_index=None#sorted copy of the values
+        self.hash_scan_cost=0#elements scanned since the hash index was last dropped
+        self.sorted_scan_cost=0
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __getitem__(self,i):
+        return self.items[i]
+    
+    def __iter__(self):
+        return iter(self.items)
+    
+    #mutations keep a built index up to date instead of throwing it away
+    def append(self,value):
+        self.items.append(value)
+        if self.hash_index is not None:
+            self.hash_index.setdefault(value,[]).append(len(self.items)-1)
+        if self.sorted_index is not None:
+            bisect.insort(self.sorted_index,value)
+    
+    def __setitem__(self,i,value):
+        i=range(len(self.items))[i]
+        old=self.items[i]
+        self.items[i]=value
+        if self.hash_index is not None:
+            self._forget_position(old,i)
+            bisect.insort(self.hash_index.setdefault(value,[]),i)
+        if self.sorted_index is not None:
+            del self.sorted_index[bisect.bisect_left(self.sorted_index,old)]
+            bisect.insort(self.sorted_index,value)
+    
+    def pop(self,i=-1):
+        i=range(len(self.items))[i]
+        value=self.items.pop(i)
+        if self.hash_index is not None:
+            if i==len(self.items):
+                self._forget_position(value,i)
+            else:
+                #every later position shifts down, so the hash index has to be rebuilt
+                self.hash_index=None
+                self.hash_scan_cost=0
+        if self.sorted_index is not None:
+            del self.sorted_index[bisect.bisect_left(self.sorted_index,value)]
+        return value
+    
+    def _forget_position(self,value,i):
+        positions=self.hash_index[value]
+        del positions[bisect.bisect_left(positions,i)]
+        if not positions:
+            del self.hash_index[value]
+    
+    #index of the first occurrence of target, or -1
+    def find(self,target):
+        self.queries+=1
+        if self.hash_index is None:
+            n=len(self.items)
+            if self.hash_scan_cost<self.build_factor*n:
+                self.hash_scan_cost+=n
+                return linear_search(self.items,target)
+            self._build_hash_index()
+        positions=self.hash_index.get(target)
+        return positions[0] if positions else -1
+    
+    def __contains__(self,target):
+        return self.find(target)!=-1
+    
+    #number of items with low<=item<=high
+    def count_range(self,low,high):
+        self.queries+=1
+        if self.sorted_index is None:
+            n=len(self.items)
+            if self.sorted_scan_cost<self.build_factor*n*max(n,1).bit_length():
+                self.sorted_scan_cost+=n
+                return sum(1 for item in self.items if low<=item<=high)
+            self.sorted_index=sorted(self.items)
+        return count_in_range(self.sorted_index,low,high)
+    
+    def _build_hash_index(self):
+        self.hash_index={}
+        for i,value in enumerate(self.items):
+            self.hash_index.setdefault(value,[]).append(i)
+
+def _timed(func,*args):
+    start=time.perf_counter()
+    result=func(*args)
+    return time.perf_counter()-start,result
+
+#benchmark the batch paths against the scalar functions (time per target in microseconds)
+def benchmark_batch_search(n=100000,m=100000,scalar_sample=200):
+    import random
+    rng=random.Random(42)
+    data=rng.sample(range(n*4),n)
+    sorted_data=sorted(data)
+    targets=[rng.randrange(n*4) for _ in range(m)]
+    sorted_targets=sorted(targets)
+    sample=targets[:scalar_sample]#the scalar linear scan is too slow to run on every target
+    rows=[
+        ("linear_search (scalar)",len(sample),_timed(lambda: [linear_search(data,t) for t in sample])),
+        ("test_search (scalar)",m,_timed(lambda: [test_search(sorted_data,t) for t in targets])),
+        ("batch_linear_search",m,_timed(batch_linear_search,data,targets)),
+        ("batch_binary_search",m,_timed(batch_binary_search,sorted_data,targets)),
+        ("merge_join_search",m,_timed(merge_join_search,sorted_data,sorted_targets)),
+        ("gallop_batch_search",m,_timed(gallop_batch_search,sorted_data,sorted_targets)),
+    ]
+    print(f"n={n} targets={m} numpy={'yes' if np is not None else 'no'}")
+    for name,count,(seconds,_) in rows:
+        print(f"{name:<24}{seconds/count*1e6:>12.3f} us/target")
+
+#one sorted dataset per key distribution
+def _search_distributions(n,rng):
+    return {
+        "uniform":sorted(rng.sample(range(n*4),n)),
+        "skewed":sorted(int(rng.expovariate(1/n)) for _ in range(n)),
+        "clustered":sorted(rng.choice((0,10**9))+rng.randrange(n) for _ in range(n)),
+        "duplicates":sorted(rng.randrange(n//100+1) for _ in range(n)),
+    }
+
+#time every variant on arr and return (name, seconds per target) of the fastest
+def fastest_search_variant(arr,targets):
+    eytzinger=EytzingerIndex(arr)
+    variants={
+        "test_search":lambda t: test_search(arr,t),
+        "interpolation_search":lambda t: interpolation_search(arr,t),
+        "exponential_search":lambda t: exponential_search(arr,t),
+        "eytzinger_search":eytzinger.search,
+    }
+    timings={}
+    for name,search in variants.items():
+        seconds,_=_timed(lambda: [search(t) for t in targets])
+        timings[name]=seconds/len(targets)
+    return min(timings.items(),key=lambda x: x[1]),timings
+
+def benchmark_search_variants(n=100000,m=20000):
+    import random
+    rng=random.Random(42)
+    for distribution,arr in _search_distributions(n,rng).items():
+        #half the targets are present, half are random probes
+        targets=[rng.choice(arr) if i%2 else rng.randint(arr[0],arr[-1]) for i in range(m)]
+        (best,_),timings=fastest_search_variant(arr,targets)
+        print(f"{distribution} (n={n}):")
+        for name,seconds in timings.items():
+            print(f"  {name:<22}{seconds*1e6:>10.3f} us/target")
+        print(f"  fastest: {best}")
+
+if __name__=="__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_batch_search()
+        sys.exit()
+    if "--benchmark-variants" in sys.argv:
+        benchmark_search_variants()
+        sys.exit()
+    
+    #3,test apython function using real world example dataset
+    arr=[1,3,5,7,9] # unsorted dataset
+    target=5#we want to search for the value 50
+    
+    #linear search test
+    linear_result=linear_search(arr,target)
+    print(f"linear search result for{target}:inex{linear_result}")
+    
+    
+    
+    #binary search test 
+    sorted_arr=sorted(arr)#binary search requires the array to be Sorted 
+    binary_result=test_search(sorted_arr,target)
+    print(f"binary search result for{target}:index {binary_result}")
+    
+    #duplicates: where the run of a value starts and ends
+    dup_arr=[1,3,5,5,5,7,9]
+    print(f"equal range for{target}:{equal_range(dup_arr,target)} count:{count_in_range(dup_arr,target,target)}")
+    
+    #repeated searches: the collection builds its index once instead of sorting on every query
+    collection=SearchableCollection(arr)
+    for _ in range(5):
+        collection_result=collection.find(target)
+    print(f"collection search result for{target}:index {collection_result} (indexed: {collection.hash_index is not None})")
\ No newline at end of file